@@ -5,6 +5,7 @@ from typing import cast
 import asyncio
 
 import json
+from functools import cache
 from pathlib import Path
 
 from eth_typing import URI, ChecksumAddress
@@ -42,11 +43,16 @@ def load_abi(path: str | Path) -> list[dict]:
         FileNotFoundError: If the file does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
         KeyError: If the JSON does not contain an "abi" field.
+
+    Each file is read from disk once per process, but every call parses its
+    own copy, so callers never share (or can corrupt) cached ABI entries.
     """
-    p = Path(path)
-    with p.open() as f:
-        data = json.load(f)
-    return data["abi"]
+    return json.loads(_read_abi_text(Path(path)))["abi"]
+
+
+@cache
+def _read_abi_text(path: Path) -> str:
+    return path.read_text()
 
 
 def load_core_vaults_collector_abi() -> list[dict]:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from ...settings import OracleSettings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssetData:
     """Raw asset data from a protocol adapter."""
 
@@ -13,6 +13,7 @@ from web3.exceptions import ContractLogicError, ProviderConnectionError
 from web3.types import EventData
 
 from ...abi import fetch_subvault_addresses, load_stakewise_vault_abi
+from ...addresses import checksum_address
 from ...constants import (
     STAKEWISE_ADDRESSES,
     STAKEWISE_EXIT_LOG_CHUNK,
@@ -93,7 +94,7 @@ class StakeWiseAdapter(BaseAssetAdapter):
 
         self.block_identifier = config.block_number_required
         self.eth_asset = self._resolve_eth_asset(config)
-        self.os_token_address = self.w3.to_checksum_address(resolved.os_token)
+        self.os_token_address = checksum_address(resolved.os_token)
 
         # Explicit list > Adapter config > Single explicit or default
         resolved_vaults = (
@@ -127,11 +128,10 @@ class StakeWiseAdapter(BaseAssetAdapter):
         self._rpc_delay = getattr(config, "rpc_delay", 0.15)
         self._rpc_jitter = getattr(config, "rpc_jitter", 0.10)
         self._block_timestamp_cache: dict[int, int] = {}
+        self._converted_assets_cache: dict[tuple[str, int], int] = {}
 
         extra_address_candidates = [
-            self.w3.to_checksum_address(addr)
-            for addr in adapter_config.extra_addresses
-            if addr
+            checksum_address(addr) for addr in adapter_config.extra_addresses if addr
         ]
         deduped: dict[str, str] = {}
         for checksum in extra_address_candidates:
@@ -162,7 +162,7 @@ class StakeWiseAdapter(BaseAssetAdapter):
                     await asyncio.sleep(delay)
 
     async def fetch_assets(self, subvault_address: str) -> list[AssetData]:
-        user = self.w3.to_checksum_address(subvault_address)
+        user = checksum_address(subvault_address)
         logger.info(
             "StakeWise adapter collecting balances — user=%s block=%s skip_exit_queue=%s",
             user,
@@ -170,44 +170,21 @@ class StakeWiseAdapter(BaseAssetAdapter):
             self._skip_exit_queue_scan,
         )
 
-        total_staked = 0
-        total_queue = 0
-        total_claimable = 0
-        total_os_liabilities = 0
-        total_tickets = 0
-
-        for context in self.vault_contexts:
-            user_state = await self._fetch_account_state(context.contract, user)
-
-            # Skip expensive exit queue scan if user has no position
-            if user_state.assets == 0 and user_state.os_shares == 0:
-                logger.debug(
-                    "StakeWise Adapter skipping — no position for user=%s vault=%s",
-                    user,
-                    context.address,
-                )
-                continue
-
-            if self._skip_exit_queue_scan:
-                total_staked += user_state.assets
-                total_os_liabilities += user_state.os_shares
-                continue
-
-            tickets = await self._scan_exit_queue_tickets(context, user)
-            exposure = await self._compute_exit_exposure(context, user_state, tickets)
-
-            total_staked += exposure.staked_eth
-            total_queue += exposure.eth_in_queue
-            total_claimable += exposure.eth_claimable
-            total_os_liabilities += exposure.os_shares_liability
-            total_tickets += exposure.ticket_count
+        # Vaults are independent, so their reads overlap; _rpc_sem still
+        # bounds the number of in-flight RPC calls.
+        exposures = await asyncio.gather(
+            *(
+                self._fetch_vault_exposure(context, user)
+                for context in self.vault_contexts
+            )
+        )
 
         aggregated = ExitExposure(
-            staked_eth=total_staked,
-            eth_in_queue=total_queue,
-            eth_claimable=total_claimable,
-            os_shares_liability=total_os_liabilities,
-            ticket_count=total_tickets,
+            staked_eth=sum(e.staked_eth for e in exposures),
+            eth_in_queue=sum(e.eth_in_queue for e in exposures),
+            eth_claimable=sum(e.eth_claimable for e in exposures),
+            os_shares_liability=sum(e.os_shares_liability for e in exposures),
+            ticket_count=sum(e.ticket_count for e in exposures),
         )
 
         assets: list[AssetData] = []
@@ -223,6 +200,29 @@ class StakeWiseAdapter(BaseAssetAdapter):
         self._log_summary(user, aggregated)
         return assets
 
+    async def _fetch_vault_exposure(
+        self, context: StakewiseVaultContext, user: str
+    ) -> ExitExposure:
+        user_state = await self._fetch_account_state(context, user)
+
+        # Skip expensive exit queue scan if user has no position
+        if user_state.assets == 0 and user_state.os_shares == 0:
+            logger.debug(
+                "StakeWise Adapter skipping — no position for user=%s vault=%s",
+                user,
+                context.address,
+            )
+            return ExitExposure()
+
+        if self._skip_exit_queue_scan:
+            return ExitExposure(
+                staked_eth=user_state.assets,
+                os_shares_liability=user_state.os_shares,
+            )
+
+        tickets = await self._scan_exit_queue_tickets(context, user)
+        return await self._compute_exit_exposure(context, user_state, tickets)
+
     async def fetch_all_assets(self) -> list[AssetData]:
         """Fetch StakeWise positions for all subvaults plus extra addresses."""
 
@@ -307,7 +307,7 @@ class StakeWiseAdapter(BaseAssetAdapter):
         )
 
     def _build_contract(self, address: str, abi: Iterable[dict]) -> Contract:
-        checksum = self.w3.to_checksum_address(address)
+        checksum = checksum_address(address)
         return self.w3.eth.contract(address=checksum, abi=list(abi))
 
     def _build_vault_context(self, address: str) -> StakewiseVaultContext:
@@ -317,14 +317,15 @@ class StakeWiseAdapter(BaseAssetAdapter):
         if callable(v2_event):
             exit_events.append(cast(ContractEvent, v2_event()))
         return StakewiseVaultContext(
-            address=self.w3.to_checksum_address(address),
+            address=checksum_address(address),
             contract=contract,
             exit_events=exit_events,
         )
 
     async def _fetch_account_state(
-        self, vault_contract: Contract, account: str
+        self, context: StakewiseVaultContext, account: str
     ) -> AccountState:
+        vault_contract = context.contract
         shares, os_shares = await asyncio.gather(
             self._rpc(
                 vault_contract.functions.getShares(account).call,
@@ -335,15 +336,25 @@ class StakeWiseAdapter(BaseAssetAdapter):
                 block_identifier=self.block_identifier,
             ),
         )
-        assets = (
-            0
-            if not shares
-            else await self._rpc(
-                vault_contract.functions.convertToAssets(shares).call,
+        assets = 0 if not shares else await self._convert_to_assets(context, shares)
+        return AccountState(assets=int(assets), os_shares=int(os_shares))
+
+    async def _convert_to_assets(
+        self, context: StakewiseVaultContext, shares: int
+    ) -> int:
+        """Convert vault shares to assets at the adapter block, memoized per vault."""
+        key = (context.address, int(shares))
+        cached = self._converted_assets_cache.get(key)
+        if cached is not None:
+            return cached
+        assets = int(
+            await self._rpc(
+                context.contract.functions.convertToAssets(shares).call,
                 block_identifier=self.block_identifier,
             )
         )
-        return AccountState(assets=int(assets), os_shares=int(os_shares))
+        self._converted_assets_cache[key] = assets
+        return assets
 
     async def _scan_exit_queue_tickets(
         self, context: StakewiseVaultContext, user: str
@@ -354,43 +365,47 @@ class StakeWiseAdapter(BaseAssetAdapter):
         tickets: dict[int, ExitQueueTicket] = {}
         min_block = self._resolve_min_block()
 
-        iterations = 0
         logger.warning(
             f"StakeWise exit queue scan start for address:{user} StakewiseVault: {context.address} from block {min_block}, this might take some time..."
         )
-        for from_block, to_block in self._block_ranges(
-            self.block_identifier, min_block
-        ):
-            iterations += 1
-            for event in context.exit_events:
-                logs = await self._get_exit_logs(event, user, from_block, to_block)
-                for log in logs:
-                    args = log["args"]
-                    ticket_id = int(args["positionTicket"])
-                    block_number = int(log["blockNumber"])
-                    log_index = int(log["logIndex"])
-
-                    existing = tickets.get(ticket_id)
-                    if existing and not (
-                        block_number > existing.block_number
-                        or (
-                            block_number == existing.block_number
-                            and log_index > existing.log_index
-                        )
-                    ):
-                        continue
-
-                    timestamp = await self._resolve_block_timestamp(block_number)
-                    assets_value = args.get("assets")
-                    tickets[ticket_id] = ExitQueueTicket(
-                        ticket=ticket_id,
-                        shares=int(args["shares"]),
-                        receiver=self.w3.to_checksum_address(args["receiver"]),
-                        block_number=block_number,
-                        log_index=log_index,
-                        timestamp=timestamp,
-                        assets_hint=None if assets_value is None else int(assets_value),
+        ranges = list(self._block_ranges(self.block_identifier, min_block))
+        iterations = len(ranges)
+        # Chunks are independent; _rpc bounds how many queries are in flight.
+        log_batches = await asyncio.gather(
+            *(
+                self._get_exit_logs(event, user, from_block, to_block)
+                for from_block, to_block in ranges
+                for event in context.exit_events
+            )
+        )
+        for logs in log_batches:
+            for log in logs:
+                args = log["args"]
+                ticket_id = int(args["positionTicket"])
+                block_number = int(log["blockNumber"])
+                log_index = int(log["logIndex"])
+
+                existing = tickets.get(ticket_id)
+                if existing and not (
+                    block_number > existing.block_number
+                    or (
+                        block_number == existing.block_number
+                        and log_index > existing.log_index
                     )
+                ):
+                    continue
+
+                timestamp = await self._resolve_block_timestamp(block_number)
+                assets_value = args.get("assets")
+                tickets[ticket_id] = ExitQueueTicket(
+                    ticket=ticket_id,
+                    shares=int(args["shares"]),
+                    receiver=checksum_address(args["receiver"]),
+                    block_number=block_number,
+                    log_index=log_index,
+                    timestamp=timestamp,
+                    assets_hint=None if assets_value is None else int(assets_value),
+                )
 
         ordered = sorted(tickets.values(), key=lambda t: (t.block_number, t.log_index))
         logger.info(
@@ -449,11 +464,7 @@ class StakeWiseAdapter(BaseAssetAdapter):
         for ticket in tickets:
             ticket_assets = ticket.assets_hint
             if ticket_assets is None:
-                ticket_assets = await self._rpc(
-                    context.contract.functions.convertToAssets(ticket.shares).call,
-                    block_identifier=self.block_identifier,
-                )
-                ticket_assets = int(ticket_assets)
+                ticket_assets = await self._convert_to_assets(context, ticket.shares)
 
             exit_queue_index = await self._fetch_exit_queue_index(
                 context.contract, ticket.ticket
@@ -483,11 +494,7 @@ class StakeWiseAdapter(BaseAssetAdapter):
 
             eth_claimable += exit_assets
             if left_tickets > 0:
-                queue_assets = await self._rpc(
-                    context.contract.functions.convertToAssets(left_tickets).call,
-                    block_identifier=self.block_identifier,
-                )
-                eth_in_queue += int(queue_assets)
+                eth_in_queue += await self._convert_to_assets(context, left_tickets)
 
         return ExitExposure(
             staked_eth=user_state.assets,
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import random
-from typing import TYPE_CHECKING
 
 import backoff
 from eth.constants import ZERO_ADDRESS
@@ -16,10 +15,6 @@ from ...logger import get_logger
 from ...settings import Network, OracleSettings
 from .base import AssetData, BaseAssetAdapter
 
-if TYPE_CHECKING:
-    # Kept for type checkers that prefer local import inference.
-    from ...settings import OracleSettings
-
 logger = get_logger(__name__)
 
 
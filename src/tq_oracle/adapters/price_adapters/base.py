@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ...settings import OracleSettings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PriceData:
     """Price data from a price adapter."""
 
     base_asset: str
-    prices: dict[str, int]  # asset_address -> price_wei (18 decimals)
+    # asset_address -> price_wei (18 decimals)
+    prices: dict[str, int] = field(default_factory=dict)
 
 
 class BasePriceAdapter(ABC):
@@ -26,6 +26,12 @@ class ETHAdapter(BasePriceAdapter):
             raise ValueError("ETH address is required for ETH adapter")
         self.eth_address = eth_address
         self.weth_address = assets["WETH"]
+        # Assets pegged 1:1 to ETH, keyed by lowercase address.
+        self._static_prices: dict[str, tuple[str, int]] = {
+            address.lower(): (address, 10**18)
+            for address in (self.eth_address, self.weth_address)
+            if address
+        }
 
         self._oseth_address = (
             config.assets.get("OSETH")
@@ -87,13 +93,11 @@ class ETHAdapter(BasePriceAdapter):
         if prices_accumulator.base_asset != self.eth_address:
             raise ValueError("ETH adapter only supports ETH as base asset")
 
-        asset_addresses_lower = [addr.lower() for addr in asset_addresses]
+        asset_addresses_lower = {addr.lower() for addr in asset_addresses}
 
-        if self.eth_address.lower() in asset_addresses_lower:
-            prices_accumulator.prices[self.eth_address] = 10**18
-
-        if self.weth_address and self.weth_address.lower() in asset_addresses_lower:
-            prices_accumulator.prices[self.weth_address] = 10**18
+        for address_lower in asset_addresses_lower & self._static_prices.keys():
+            address, price = self._static_prices[address_lower]
+            prices_accumulator.prices[address] = price
 
         if self._oseth_address and self._oseth_address.lower() in asset_addresses_lower:
             oseth_price = await self._get_oseth_price()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from fractions import Fraction
 from urllib.parse import urlencode
 
 import requests
@@ -24,6 +26,7 @@ class PythAdapter(BasePriceAdapter):
         self.hermes_endpoint = config.pyth_hermes_endpoint
         self.staleness_threshold = config.pyth_staleness_threshold
         self.max_confidence_ratio = config.pyth_max_confidence_ratio
+        self._max_confidence = Fraction(str(self.max_confidence_ratio))
 
         self._address_to_symbol: dict[str, str] = {
             self._canonical_address(addr): sym
@@ -31,6 +34,10 @@ class PythAdapter(BasePriceAdapter):
             if isinstance(addr, str) and addr
         }
         self._feed_ids: dict[str, str] = {}
+        self._feed_id_locks: dict[str, asyncio.Lock] = {}
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
 
     @property
     def adapter_name(self) -> str:
@@ -57,9 +64,31 @@ class PythAdapter(BasePriceAdapter):
         scaled = value * (10**shift) if shift >= 0 else value // (10**-shift)
         return scaled
 
+    def _get_session(self) -> requests.Session:
+        """Return the calling thread's HTTP session, creating it on first use.
+
+        requests.Session is not documented as thread-safe, so each worker
+        thread gets its own session. Gathered Hermes requests run in parallel,
+        and each thread reuses its own kept-alive connection.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every HTTP session opened by the adapter's worker threads."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        self._local = threading.local()
+        for session in sessions:
+            session.close()
+
     async def _http_get(self, url: str, *, params: dict | None = None):
         return await asyncio.to_thread(
-            lambda: requests.get(url, params=params, timeout=2.0)
+            lambda: self._get_session().get(url, params=params, timeout=2.0)
         )
 
     async def _resolve_feed_id(self, symbol: str, quote: str = "USD") -> str | None:
@@ -68,19 +97,26 @@ class PythAdapter(BasePriceAdapter):
         if cached:
             return cached
 
-        resolved = await self._discover_feed_from_api(symbol, quote)
-        if resolved:
-            self._feed_ids[key] = resolved
-            return resolved
-
-        fallback = PYTH_PRICE_FEED_IDS.get(key)
-        if fallback:
-            self._feed_ids[key] = fallback
-            logger.warning("Falling back to static feed ID for %s", key)
-            return fallback
-
-        logger.warning("No feed ID found for %s", key)
-        return None
+        # Concurrent lookups of the same pair wait for a single discovery call.
+        lock = self._feed_id_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._feed_ids.get(key)
+            if cached:
+                return cached
+
+            resolved = await self._discover_feed_from_api(symbol, quote)
+            if resolved:
+                self._feed_ids[key] = resolved
+                return resolved
+
+            fallback = PYTH_PRICE_FEED_IDS.get(key)
+            if fallback:
+                self._feed_ids[key] = fallback
+                logger.warning("Falling back to static feed ID for %s", key)
+                return fallback
+
+            logger.warning("No feed ID found for %s", key)
+            return None
 
     async def _discover_feed_from_api(
         self, symbol: str, quote: str = "USD"
@@ -138,10 +174,10 @@ class PythAdapter(BasePriceAdapter):
         denom = abs(price_18)
         if denom == 0:
             raise ValueError(f"{symbol} price is zero")
-        conf_ratio = conf_18 / denom
-        if conf_ratio > self.max_confidence_ratio:
+        limit = self._max_confidence
+        if conf_18 * limit.denominator > denom * limit.numerator:
             raise ValueError(
-                f"{symbol} confidence ratio {conf_ratio:.4f} exceeds maximum {self.max_confidence_ratio}"
+                f"{symbol} confidence ratio {conf_18 / denom:.4f} exceeds maximum {self.max_confidence_ratio}"
             )
 
     def _symbol_for(self, address: str) -> str | None:
@@ -157,21 +193,12 @@ class PythAdapter(BasePriceAdapter):
                 f"Base asset {prices_accumulator.base_asset} not recognized by Pyth adapter configuration"
             )
 
-        base_feed_id = await self._resolve_feed_id(base_symbol, "USD")
-        if not base_feed_id:
-            raise ValueError(
-                f"{base_symbol}/USD price feed could not be resolved from Pyth Hermes"
-            )
-
         canonical_to_original: dict[str, str] = {}
         for address in asset_addresses:
             canonical_address = self._canonical_address(address)
             if canonical_address != base_address:
                 canonical_to_original.setdefault(canonical_address, address)
 
-        if not canonical_to_original:
-            return prices_accumulator
-
         canonical_to_symbol = {
             canonical: symbol
             for canonical, symbol in (
@@ -187,10 +214,21 @@ class PythAdapter(BasePriceAdapter):
                 canonical_to_original[canonical],
             )
 
+        # Resolve the base feed alongside the asset feeds so discovery
+        # requests overlap instead of running one after another.
         symbols = list(canonical_to_symbol.values())
-        feed_ids = await asyncio.gather(
-            *(self._resolve_feed_id(sym, "USD") for sym in symbols)
+        base_feed_id, *feed_ids = await asyncio.gather(
+            self._resolve_feed_id(base_symbol, "USD"),
+            *(self._resolve_feed_id(sym, "USD") for sym in symbols),
         )
+        if not base_feed_id:
+            raise ValueError(
+                f"{base_symbol}/USD price feed could not be resolved from Pyth Hermes"
+            )
+
+        if not canonical_to_original:
+            return prices_accumulator
+
         resolved_assets: dict[str, tuple[str, str, str]] = {}
         for canonical, symbol, feed_id in zip(
             canonical_to_symbol.keys(), symbols, feed_ids
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from fractions import Fraction
 
 from tq_oracle.adapters.check_adapters.base import CheckResult
 from tq_oracle.adapters.price_adapters.base import PriceData
@@ -52,3 +53,35 @@ class BasePriceValidator(ABC):
 
         deviation_ratio = abs(reference_price - actual_price) / reference_price
         return deviation_ratio * 100
+
+    @staticmethod
+    def _tolerance_ratio(tolerance_percentage: float) -> Fraction:
+        """Convert a tolerance percentage into an exact fractional ratio."""
+        return Fraction(str(tolerance_percentage)) / 100
+
+    def _exceeds_deviation(
+        self, reference_price: int, actual_price: int, tolerance: Fraction
+    ) -> bool:
+        """Check whether two prices deviate by more than `tolerance`.
+
+        Integer-only equivalent of comparing
+        `_calculate_price_deviation_percentage` against a percentage threshold.
+
+        Args:
+            reference_price: The reference price (e.g., from Pyth)
+            actual_price: The actual price being validated
+            tolerance: Maximum allowed deviation as a ratio, see `_tolerance_ratio`
+
+        Returns:
+            True if the deviation is strictly greater than the tolerance
+
+        Raises:
+            ValueError: If reference_price is zero or negative
+        """
+        if reference_price <= 0:
+            raise ValueError("reference_price must be positive")
+
+        return (
+            abs(reference_price - actual_price) * tolerance.denominator
+            > reference_price * tolerance.numerator
+        )
@@ -17,6 +17,8 @@ class PythValidator(BasePriceValidator):
         self.pyth_adapter = PythAdapter(config)
         self.warning_tolerance = config.price_warning_tolerance_percentage
         self.failure_tolerance = config.price_failure_tolerance_percentage
+        self._warning_ratio = self._tolerance_ratio(self.warning_tolerance)
+        self._failure_ratio = self._tolerance_ratio(self.failure_tolerance)
 
     @property
     def name(self) -> str:
@@ -41,6 +43,13 @@ class PythValidator(BasePriceValidator):
             f" Asset addresses to validate (excluding base asset): {asset_addresses}"
         )
 
+        if not asset_addresses:
+            return CheckResult(
+                passed=True,
+                message="All prices are within acceptable deviation from Pyth",
+                retry_recommended=False,
+            )
+
         pyth_prices = PriceData(base_asset=price_data.base_asset, prices={})
 
         try:
@@ -52,6 +61,8 @@ class PythValidator(BasePriceValidator):
             return CheckResult(
                 passed=False, message=f"Pyth API error: {e}", retry_recommended=True
             )
+        finally:
+            self.pyth_adapter.close()
 
         logger.debug(f" Fetched prices for {len(pyth_prices.prices)} assets")
         logger.debug(f" Pyth price keys: {list(pyth_prices.prices.keys())}")
@@ -63,19 +74,20 @@ class PythValidator(BasePriceValidator):
                 f" {asset_address}: Pyth price={pyth_price}, Oracle price={oracle_price}"
             )
 
-            deviation_pct = self._calculate_price_deviation_percentage(
-                pyth_price, oracle_price
-            )
-            logger.debug(f" {asset_address}: Deviation = {deviation_pct:.2f}%")
-
-            if deviation_pct > self.failure_tolerance:
+            if self._exceeds_deviation(pyth_price, oracle_price, self._failure_ratio):
+                deviation_pct = self._calculate_price_deviation_percentage(
+                    pyth_price, oracle_price
+                )
                 return CheckResult(
                     passed=False,
                     message=f"Pyth price for {asset_address} is {deviation_pct:.2f}% off from oracle price (failure threshold: {self.failure_tolerance}%)",
                     retry_recommended=False,
                 )
 
-            if deviation_pct > self.warning_tolerance:
+            if self._exceeds_deviation(pyth_price, oracle_price, self._warning_ratio):
+                deviation_pct = self._calculate_price_deviation_percentage(
+                    pyth_price, oracle_price
+                )
                 logger.warning(
                     f"Pyth price for {asset_address} is {deviation_pct:.2f}% off from oracle price (warning threshold: {self.warning_tolerance}%)"
                 )
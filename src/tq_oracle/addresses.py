@@ -0,0 +1,22 @@
+"""Address normalization helpers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+
+
+@lru_cache(maxsize=4096)
+def _checksum_lower(address: str) -> ChecksumAddress:
+    return Web3.to_checksum_address(address)
+
+
+def checksum_address(address: str) -> ChecksumAddress:
+    """Checksum an address, hashing each distinct address only once.
+
+    Results are memoized per process by lowercased address, so differently
+    cased copies of the same address share one Keccak computation.
+    """
+    return _checksum_lower(address.lower())
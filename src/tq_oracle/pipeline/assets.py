@@ -267,16 +267,19 @@ async def collect_assets(ctx: PipelineContext) -> None:
         len(adapter_tasks),
     )
 
-    default_results = await asyncio.gather(
-        *[task for _, task in asset_fetch_tasks], return_exceptions=True
-    )
-
-    per_subvault_results = await asyncio.gather(
-        *[
-            adapter.fetch_assets(subvault_addr)
-            for subvault_addr, adapter, _ in adapter_tasks
-        ],
-        return_exceptions=True,
+    # Both groups run at once so the per-subvault adapters do not wait for the
+    # slowest default adapter before issuing their RPC calls.
+    default_results, per_subvault_results = await asyncio.gather(
+        asyncio.gather(
+            *[task for _, task in asset_fetch_tasks], return_exceptions=True
+        ),
+        asyncio.gather(
+            *[
+                adapter.fetch_assets(subvault_addr)
+                for subvault_addr, adapter, _ in adapter_tasks
+            ],
+            return_exceptions=True,
+        ),
     )
 
     asset_data: list[list[AssetData]] = []
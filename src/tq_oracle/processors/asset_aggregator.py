@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-
-from web3 import Web3
+from itertools import chain
 
 from ..adapters.asset_adapters.base import AssetData
+from ..addresses import checksum_address
 
 
 @dataclass
@@ -31,21 +31,30 @@ async def compute_total_aggregated_assets(
     Note: All asset addresses are normalized to EIP-55 checksummed format to ensure
     consistent aggregation regardless of how different adapters format addresses.
     """
+    return _compute_total_aggregated_assets_sync(protocol_assets)
+
+
+def _compute_total_aggregated_assets_sync(
+    protocol_assets: list[list[AssetData]],
+) -> AggregatedAssets:
+    """Synchronous body of `compute_total_aggregated_assets`; does no I/O."""
     aggregated: dict[str, int] = {}
-    tvl_only_assets: set[str] = set()
-    non_tvl_only_assets: set[str] = set()
-
-    for adapter_assets in protocol_assets:
-        for asset in adapter_assets:
-            checksummed_address = Web3.to_checksum_address(asset.asset_address)
-            current = aggregated.get(checksummed_address, 0)
-            aggregated[checksummed_address] = current + asset.amount
-            if getattr(asset, "tvl_only", False):
-                tvl_only_assets.add(checksummed_address)
-            else:
-                non_tvl_only_assets.add(checksummed_address)
-    if tvl_only_assets & non_tvl_only_assets:
-        raise ValueError(
-            f"Assets with conflicting tvl_only flags: {tvl_only_assets & non_tvl_only_assets}"
+    tvl_only_flags: dict[str, bool] = {}
+    conflicts: set[str] = set()
+
+    for asset in chain.from_iterable(protocol_assets):
+        checksummed_address = checksum_address(asset.asset_address)
+        aggregated[checksummed_address] = (
+            aggregated.get(checksummed_address, 0) + asset.amount
         )
+        tvl_only = bool(asset.tvl_only)
+        seen = tvl_only_flags.get(checksummed_address)
+        if seen is None:
+            tvl_only_flags[checksummed_address] = tvl_only
+        elif seen != tvl_only:
+            conflicts.add(checksummed_address)
+
+    if conflicts:
+        raise ValueError(f"Assets with conflicting tvl_only flags: {conflicts}")
+    tvl_only_assets = {address for address, flag in tvl_only_flags.items() if flag}
     return AggregatedAssets(assets=aggregated, tvl_only_assets=tvl_only_assets)
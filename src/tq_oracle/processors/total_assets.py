@@ -24,7 +24,10 @@ def calculate_total_assets(
         )
         raise ValueError(f"Invalid prices for assets: {invalid_details}")
 
+    # Truncate per asset, not once over the sum: each asset's value is
+    # floored on its own, so hoisting the division would change the total.
+    price_map = prices.prices
     return sum(
-        aggregated_assets.assets[i] * prices.prices[i] // (10**18)
-        for i in aggregated_assets.assets
+        amount * price_map[asset_address] // (10**18)
+        for asset_address, amount in aggregated_assets.assets.items()
     )
@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import logging
 
+from eth_abi import encode
 from eth_typing.evm import ChecksumAddress
-from web3 import Web3
+from eth_utils import function_signature_to_4byte_selector
 
-from ..abi import load_oracle_abi
+from ..addresses import checksum_address
 from .generator import OracleReport
 
 logger = logging.getLogger(__name__)
 
+# IOracle.submitReports(Report[] reports), Report = (address asset, uint224 priceD18)
+_SUBMIT_REPORTS_ARG_TYPES = ("(address,uint224)[]",)
+_SUBMIT_REPORTS_SELECTOR = function_signature_to_4byte_selector(
+    f"submitReports({','.join(_SUBMIT_REPORTS_ARG_TYPES)})"
+)
+
 
 def encode_submit_reports(
     oracle_address: str,
@@ -29,20 +36,16 @@ def encode_submit_reports(
     The submitReports function expects:
         struct Report[] reports where Report = (address asset, uint224 priceD18)
     """
-    w3 = Web3()
-    abi = load_oracle_abi()
-
-    checksum_address = w3.to_checksum_address(oracle_address)
-    contract = w3.eth.contract(address=checksum_address, abi=abi)
-    base_asset = w3.to_checksum_address(report.base_asset)
-
-    reports_array: list[tuple[ChecksumAddress, int]] = [
-        (w3.to_checksum_address(asset_addr), price_d18)
-        for asset_addr, price_d18 in sorted(
-            report.final_prices.items(),
-            key=lambda x: 0 if w3.to_checksum_address(x[0]) == base_asset else 1,
-        )
-    ]
+    base_asset = checksum_address(report.base_asset)
+
+    # Checksum each asset once; the stable sort then moves the base asset first.
+    reports_array: list[tuple[ChecksumAddress, int]] = sorted(
+        (
+            (checksum_address(asset_addr), price_d18)
+            for asset_addr, price_d18 in report.final_prices.items()
+        ),
+        key=lambda report_entry: report_entry[0] != base_asset,
+    )
 
     logger.info("Encoding submitReports() with %d report(s):", len(reports_array))
     for asset_addr, price_d18 in reports_array:
@@ -51,11 +54,8 @@ def encode_submit_reports(
             "  - Asset: %s, Price: %d D18 (%.6f)", asset_addr, price_d18, price_decimal
         )
 
-    calldata_hex = contract.encode_abi(
-        abi_element_identifier="submitReports",
-        args=[reports_array],
+    calldata = _SUBMIT_REPORTS_SELECTOR + encode(
+        _SUBMIT_REPORTS_ARG_TYPES, [reports_array]
     )
 
-    calldata = bytes.fromhex(calldata_hex.removeprefix("0x"))
-
     return (oracle_address, calldata)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 from ..processors.asset_aggregator import AggregatedAssets
 from ..processors.oracle_helper import FinalPrices
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OracleReport:
     """Oracle report containing asset data and prices."""
 
@@ -18,7 +18,13 @@ class OracleReport:
 
     def to_dict(self) -> dict[str, object]:
         """Convert report to dictionary format."""
-        return asdict(self)
+        return {
+            "vault_address": self.vault_address,
+            "base_asset": self.base_asset,
+            "tvl_in_base_asset": self.tvl_in_base_asset,
+            "total_assets": dict(self.total_assets),
+            "final_prices": dict(self.final_prices),
+        }
 
 
 async def generate_report(
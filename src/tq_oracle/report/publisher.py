@@ -4,7 +4,6 @@ import asyncio
 import json
 import logging
 
-import requests
 from eth.constants import ZERO_ADDRESS
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -119,8 +118,10 @@ async def send_to_safe(
 
     safe_api_url = f"{tx_service.base_url}/api/v1/safes/{safe_checksum}/"
     logger.debug("Fetching Safe info from: %s", safe_api_url)
+    # Use the service's pooled session so the later post_transaction call can
+    # reuse the same keep-alive connection to the Transaction Service.
     safe_info_response = await asyncio.to_thread(
-        requests.get, safe_api_url, timeout=10.0
+        tx_service.http_session.get, safe_api_url, timeout=10.0
     )
     safe_info_response.raise_for_status()
     safe_info_data = safe_info_response.json()
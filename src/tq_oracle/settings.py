@@ -29,7 +29,13 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
-from .constants import NetworkAssets, StrEthAddresses
+from .constants import (
+    BASE_ASSETS,
+    ETH_MAINNET_ASSETS,
+    SEPOLIA_ASSETS,
+    NetworkAssets,
+    StrEthAddresses,
+)
 
 load_dotenv()
 
@@ -40,6 +46,17 @@ class Network(str, Enum):
     BASE = "base"
 
 
+_NETWORK_ASSETS: dict[Network, NetworkAssets] = {
+    Network.MAINNET: ETH_MAINNET_ASSETS,
+    Network.SEPOLIA: SEPOLIA_ASSETS,
+    Network.BASE: BASE_ASSETS,
+}
+
+
+# Keys that must never be read from a TOML config file.
+_SECRET_FIELDS = frozenset({"private_key", "safe_txn_srvc_api_key"})
+
+
 class IdleBalancesAdapterSettings(BaseModel):
     """Configuration options for idle balance collection."""
 
@@ -245,11 +262,14 @@ class OracleSettings(BaseSettings):
                     else:
                         return {}
 
-                if not self._path.exists():
+                try:
+                    raw = self._path.read_bytes()
+                except FileNotFoundError:
+                    return {}
+                if not raw.strip():
                     return {}
 
-                with self._path.open("rb") as f:
-                    data = tomllib.load(f)  # supports top-level or [tq_oracle]
+                data = tomllib.loads(raw.decode())  # supports top-level or [tq_oracle]
                 body = data.get("tq_oracle", data)
                 if not isinstance(body, dict):
                     return {}
@@ -257,13 +277,12 @@ class OracleSettings(BaseSettings):
                 self._promote_root_keys(body)
 
                 # Check for secrets in config file
-                secret_fields = {"private_key", "safe_txn_srvc_api_key"}
-                for key in secret_fields:
-                    if key in body:
-                        raise ValueError(
-                            f"Security violation: '{key}' found in TOML config file. "
-                            f"Secrets must only be provided via environment variables or CLI flags."
-                        )
+                leaked = sorted(_SECRET_FIELDS.intersection(body))
+                if leaked:
+                    raise ValueError(
+                        f"Security violation: '{leaked[0]}' found in TOML config file. "
+                        f"Secrets must only be provided via environment variables or CLI flags."
+                    )
 
                 return body
 
@@ -346,18 +365,10 @@ class OracleSettings(BaseSettings):
         Returns:
             NetworkAssets for the configured network
         """
-        from .constants import BASE_ASSETS, ETH_MAINNET_ASSETS, SEPOLIA_ASSETS
-
-        network_assets_map = {
-            Network.MAINNET: ETH_MAINNET_ASSETS,
-            Network.SEPOLIA: SEPOLIA_ASSETS,
-            Network.BASE: BASE_ASSETS,
-        }
-
-        if self.network not in network_assets_map:
-            raise ValueError(f"Unknown network: {self.network}")
-
-        return network_assets_map[self.network]
+        try:
+            return _NETWORK_ASSETS[self.network]
+        except KeyError:
+            raise ValueError(f"Unknown network: {self.network}") from None
 
     def _resolve_streth_addresses(self) -> StrEthAddresses:
         """Return strETH addresses; only mainnet is supported."""
@@ -20,7 +20,6 @@ def config():
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_subvault_addresses_integration(config):
     adapter = IdleBalancesAdapter(config)
@@ -38,7 +37,6 @@ async def test_fetch_subvault_addresses_integration(config):
     assert subvaults == expected_subvaults
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_supported_assets_integration(config):
     adapter = IdleBalancesAdapter(config)
@@ -59,7 +57,6 @@ async def test_fetch_supported_assets_integration(config):
     assert supported_assets == expected_assets
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_asset_balance_integration(config):
     adapter = IdleBalancesAdapter(config)
@@ -94,7 +91,6 @@ async def test_fetch_asset_balance_integration(config):
     assert usdt_asset.amount >= 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_eth_balance_integration(config):
     adapter = IdleBalancesAdapter(config)
@@ -127,7 +123,6 @@ def test_merge_supported_assets_includes_configured_tokens(config):
     )
 
 
-@pytest.mark.asyncio
 async def test_fetch_assets_marks_extra_tokens_tvl_only(config, monkeypatch):
     config.adapters.idle_balances.extra_tokens = {
         "osETH": "0xf1C9acDc66974dFB6dEcB12aA385b9cD01190E38"
@@ -153,7 +148,6 @@ async def test_fetch_assets_marks_extra_tokens_tvl_only(config, monkeypatch):
     assert report_flags[base_token] is False
 
 
-@pytest.mark.asyncio
 async def test_default_additional_tokens_tvl_only(config, monkeypatch):
     # osETH comes from DEFAULT_ADDITIONAL_ASSETS for mainnet
     adapter = IdleBalancesAdapter(config)
@@ -177,7 +171,6 @@ async def test_default_additional_tokens_tvl_only(config, monkeypatch):
     assert report_flags[base_token] is False
 
 
-@pytest.mark.asyncio
 async def test_fetch_all_assets_includes_extra_addresses(config, monkeypatch):
     extra_address = "0x0000000000000000000000000000000000000009"
     config.adapters.idle_balances.extra_addresses = [extra_address]
@@ -209,7 +202,6 @@ async def test_fetch_all_assets_includes_extra_addresses(config, monkeypatch):
     assert set(recorded) == expected
 
 
-@pytest.mark.asyncio
 async def test_fetch_all_assets_fails_if_any_vault_fails(config, monkeypatch):
     adapter = IdleBalancesAdapter(config)
 
@@ -1,7 +1,7 @@
 # tests/adapters/check_adapters/test_active_submit_report_proposal_check.py
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -26,7 +26,16 @@ def config():
     )
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def mock_get_proposals(monkeypatch):
+    """Replace the Safe API lookup with an `AsyncMock` for the test."""
+    mock = AsyncMock()
+    monkeypatch.setattr(
+        ActiveSubmitReportProposalCheck, "_get_active_submit_report_proposals", mock
+    )
+    return mock
+
+
 async def test_no_safe_address_skips_check(config):
     """Verify the check passes and skips if no Safe address is configured."""
     config.safe_address = None
@@ -39,16 +48,8 @@ async def test_no_safe_address_skips_check(config):
     assert result.retry_recommended is False
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.asyncio.to_thread"
-)
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_no_active_proposals_passes(
     mock_get_proposals,
-    mock_to_thread,
     config,
 ):
     """Verify the check passes when the Safe API returns no pending proposals."""
@@ -63,10 +64,6 @@ async def test_no_active_proposals_passes(
     assert result.retry_recommended is False
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_single_active_proposal_fails_by_default(
     mock_get_proposals,
     config,
@@ -90,10 +87,6 @@ async def test_single_active_proposal_fails_by_default(
     assert result.retry_recommended is True
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_multiple_active_proposals_fails_with_count(
     mock_get_proposals,
     config,
@@ -118,10 +111,6 @@ async def test_multiple_active_proposals_fails_with_count(
     assert result.retry_recommended is True
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_ignore_flag_passes_with_warning(
     mock_get_proposals,
     config,
@@ -145,10 +134,6 @@ async def test_ignore_flag_passes_with_warning(
     assert result.retry_recommended is False
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_api_error_fails_check(
     mock_get_proposals,
     config,
@@ -165,10 +150,6 @@ async def test_api_error_fails_check(
     assert result.retry_recommended is False
 
 
-@pytest.mark.asyncio
-@patch(
-    "tq_oracle.adapters.check_adapters.active_submit_report_proposal_check.ActiveSubmitReportProposalCheck._get_active_submit_report_proposals"
-)
 async def test_mixed_transactions_filtered_correctly(
     mock_get_proposals,
     config,
@@ -190,8 +171,7 @@ async def test_mixed_transactions_filtered_correctly(
     assert "Found 3 active submitReport() proposal(s)" in result.message
 
 
-@pytest.mark.asyncio
-async def test_adapter_name(config):
+def test_adapter_name(config):
     """Test that adapter has the correct name."""
     check = ActiveSubmitReportProposalCheck(config)
     assert check.name == "Active submitReport() Proposal Check"
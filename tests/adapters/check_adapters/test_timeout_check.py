@@ -1,9 +1,10 @@
 # tests/adapters/check_adapters/test_timeout_check.py
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from tq_oracle.adapters.check_adapters import timeout_check
 from tq_oracle.adapters.check_adapters.timeout_check import (
     TimeoutCheckAdapter,
     format_time_remaining,
@@ -35,6 +36,15 @@ def create_mock_web3():
     return mock
 
 
+@pytest.fixture
+def mock_web3(monkeypatch):
+    """Patch the adapter's AsyncWeb3 and ABI loader once; return the web3 mock."""
+    mock = create_mock_web3()
+    monkeypatch.setattr(timeout_check, "AsyncWeb3", MagicMock(return_value=mock))
+    monkeypatch.setattr(timeout_check, "load_oracle_abi", MagicMock(return_value={}))
+    return mock
+
+
 def create_mock_oracle_contract(
     supported_assets_count=1,
     report_timestamp=1000000,
@@ -82,319 +92,200 @@ def test_format_time_remaining(seconds, expected):
     assert format_time_remaining(seconds) == expected
 
 
-@pytest.mark.asyncio
-async def test_timeout_elapsed_can_submit(config):
+async def test_timeout_elapsed_can_submit(config, mock_web3):
     """Test that check passes when timeout period has elapsed."""
     # Timeout = 3600, last report = 1000000, current time = 1004000
     # next_valid = 1000000 + 3600 = 1003600
     # 1004000 >= 1003600 -> CAN SUBMIT
 
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=1,
-            report_timestamp=1000000,
-            timeout=3600,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        assert result.passed
-        assert "Timeout period elapsed" in result.message
-        assert not result.retry_recommended
-
-
-@pytest.mark.asyncio
-async def test_timeout_not_elapsed_blocks_submission(config):
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=1,
+        report_timestamp=1000000,
+        timeout=3600,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    assert result.passed
+    assert "Timeout period elapsed" in result.message
+    assert not result.retry_recommended
+
+
+async def test_timeout_not_elapsed_blocks_submission(config, mock_web3):
     """Test that check fails when timeout period has not elapsed."""
     # Timeout = 3600, last report = 1000000, current time = 1001000
     # next_valid = 1000000 + 3600 = 1003600
     # 1001000 < 1003600 -> CANNOT SUBMIT (2600s remaining)
 
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=1,
-            report_timestamp=1000000,
-            timeout=3600,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        assert not result.passed
-        assert "Cannot submit" in result.message
-        assert "43m 20s remaining" in result.message
-        assert not result.retry_recommended
-
-
-@pytest.mark.asyncio
-async def test_no_previous_report_allows_submission(config):
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=1,
+        report_timestamp=1000000,
+        timeout=3600,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    assert not result.passed
+    assert "Cannot submit" in result.message
+    assert "43m 20s remaining" in result.message
+    assert not result.retry_recommended
+
+
+async def test_no_previous_report_allows_submission(config, mock_web3):
     """Test that check passes when no previous report exists (timestamp=0)."""
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        # Report with timestamp = 0 (no previous report)
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=1,
-            report_timestamp=0,
-            timeout=3600,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        assert result.passed
-        assert "No previous report exists" in result.message
-
-
-@pytest.mark.asyncio
-async def test_ignore_flag_warns_but_passes(config):
+    # Report with timestamp = 0 (no previous report)
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=1,
+        report_timestamp=0,
+        timeout=3600,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    assert result.passed
+    assert "No previous report exists" in result.message
+
+
+async def test_ignore_flag_warns_but_passes(config, mock_web3):
     """Test that ignore flag allows submission with warning when timeout not elapsed."""
     config.ignore_timeout_check = True
 
     # Timeout = 3600, last report = 1000000, current time = 1001000
     # Normally would FAIL, but ignore flag is set
 
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=1,
-            report_timestamp=1000000,
-            timeout=3600,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        # Should PASS despite timeout not elapsed
-        assert result.passed
-        assert "WARNING" in result.message
-        assert "proceeding anyway" in result.message
-        assert "--ignore-timeout-check" in result.message
-        assert not result.retry_recommended
-
-
-@pytest.mark.asyncio
-async def test_time_calculation_accuracy(config):
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=1,
+        report_timestamp=1000000,
+        timeout=3600,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1001000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    # Should PASS despite timeout not elapsed
+    assert result.passed
+    assert "WARNING" in result.message
+    assert "proceeding anyway" in result.message
+    assert "--ignore-timeout-check" in result.message
+    assert not result.retry_recommended
+
+
+async def test_time_calculation_accuracy(config, mock_web3):
     """Test that time remaining calculation is accurate."""
     # Timeout = 7200 (2 hours), last report = 1000000, current time = 1004000
     # next_valid = 1000000 + 7200 = 1007200
     # remaining = 1007200 - 1004000 = 3200s = 53m 20s
 
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=1,
-            report_timestamp=1000000,
-            timeout=7200,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        assert not result.passed
-        assert "53m 20s remaining" in result.message
-
-
-@pytest.mark.asyncio
-async def test_no_supported_assets_skips_check(config):
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=1,
+        report_timestamp=1000000,
+        timeout=7200,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    assert not result.passed
+    assert "53m 20s remaining" in result.message
+
+
+async def test_no_supported_assets_skips_check(config, mock_web3):
     """Test that check passes when no supported assets are configured."""
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        # No supported assets
-        mock_oracle = create_mock_oracle_contract(
-            supported_assets_count=0,
-            report_timestamp=1000000,
-            timeout=3600,
-        )
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
-
-        assert result.passed
-        assert "No supported assets" in result.message
-
-
-@pytest.mark.asyncio
-async def test_rpc_error_handling(config):
+    # No supported assets
+    mock_oracle = create_mock_oracle_contract(
+        supported_assets_count=0,
+        report_timestamp=1000000,
+        timeout=3600,
+    )
+    mock_web3.eth.contract.return_value = mock_oracle
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
+
+    assert result.passed
+    assert "No supported assets" in result.message
+
+
+async def test_rpc_error_handling(config, monkeypatch):
     """Test that RPC errors are caught and reported properly."""
-    with patch(
-        "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-    ) as mock_web3_class:
-        # Simulate RPC connection error
-        mock_web3_class.side_effect = RuntimeError("RPC connection failed")
+    # Simulate RPC connection error
+    monkeypatch.setattr(
+        timeout_check,
+        "AsyncWeb3",
+        MagicMock(side_effect=RuntimeError("RPC connection failed")),
+    )
 
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        result = await adapter.run_check()
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    result = await adapter.run_check()
 
-        assert not result.passed
-        assert "Error checking oracle timeout" in result.message
-        assert "RPC connection failed" in result.message
-        assert not result.retry_recommended
+    assert not result.passed
+    assert "Error checking oracle timeout" in result.message
+    assert "RPC connection failed" in result.message
+    assert not result.retry_recommended
 
 
-@pytest.mark.asyncio
-async def test_adapter_name(config):
+def test_adapter_name(config):
     """Test that adapter has the correct name."""
     adapter = TimeoutCheckAdapter(config)
     assert adapter.name == "Oracle Timeout Check"
 
 
-@pytest.mark.asyncio
-async def test_provider_cleanup_on_success(config):
+async def test_provider_cleanup_on_success(config, mock_web3):
     """Test that Web3 provider is properly disconnected after successful check."""
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract()
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        await adapter.run_check()
-
-        mock_web3.provider.disconnect.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_provider_cleanup_on_error(config):
+    mock_oracle = create_mock_oracle_contract()
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    await adapter.run_check()
+
+    mock_web3.provider.disconnect.assert_awaited_once()
+
+
+async def test_provider_cleanup_on_error(config, mock_web3):
     """Test that Web3 provider is properly disconnected even when error occurs."""
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = create_mock_web3()
-        mock_web3_class.return_value = mock_web3
-
-        # Simulate error during contract call
-        mock_web3.eth.contract.side_effect = RuntimeError("Contract error")
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        await adapter.run_check()
-
-        # Cleanup should still be called
-        mock_web3.provider.disconnect.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_provider_cleanup_handles_no_disconnect_method(config):
+    # Simulate error during contract call
+    mock_web3.eth.contract.side_effect = RuntimeError("Contract error")
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    await adapter.run_check()
+
+    # Cleanup should still be called
+    mock_web3.provider.disconnect.assert_awaited_once()
+
+
+async def test_provider_cleanup_handles_no_disconnect_method(config, mock_web3):
     """Test that cleanup handles providers without disconnect method gracefully."""
-    with (
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.AsyncWeb3"
-        ) as mock_web3_class,
-        patch(
-            "tq_oracle.adapters.check_adapters.timeout_check.load_oracle_abi"
-        ) as mock_load_abi,
-    ):
-        mock_web3 = MagicMock()
-        mock_web3.to_checksum_address = lambda addr: addr
-        # Provider without disconnect method
-        mock_web3.provider = MagicMock(spec=[])
-
-        mock_web3_class.return_value = mock_web3
-
-        mock_oracle = create_mock_oracle_contract()
-        mock_web3.eth.contract.return_value = mock_oracle
-        mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
-        mock_load_abi.return_value = {}
-
-        config._oracle_address = "0xORACLE"
-        adapter = TimeoutCheckAdapter(config)
-        # Should not raise an exception
-        await adapter.run_check()
+    # Provider without disconnect method
+    mock_web3.provider = MagicMock(spec=[])
+
+    mock_oracle = create_mock_oracle_contract()
+    mock_web3.eth.contract.return_value = mock_oracle
+    mock_web3.eth.get_block = AsyncMock(return_value={"timestamp": 1004000})
+
+    config._oracle_address = "0xORACLE"
+    adapter = TimeoutCheckAdapter(config)
+    # Should not raise an exception
+    await adapter.run_check()
@@ -0,0 +1,62 @@
+"""Shared fixtures for adapter tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+
+HERMES_DISCOVERY_PATH = "/v2/price_feeds"
+HERMES_LATEST_PRICE_PATH = "/v2/updates/price/latest"
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Minimal stand-in for `requests.Response`."""
+
+    payload: Any
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> Any:
+        return self.payload
+
+
+class HermesStub:
+    """Canned Pyth Hermes responses served in place of `requests.Session.get`.
+
+    Routes are keyed by URL path so query strings (feed ids, search terms) do
+    not need to be matched. Setting `error` makes every request raise it.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, FakeResponse] = {}
+        self.calls: list[str] = []
+        self.error: Exception | None = None
+
+    def respond(self, path: str, payload: Any) -> None:
+        self.routes[path] = FakeResponse(payload)
+
+    def respond_discovery(self, payload: Any) -> None:
+        self.respond(HERMES_DISCOVERY_PATH, payload)
+
+    def respond_latest_prices(self, payload: Any) -> None:
+        self.respond(HERMES_LATEST_PRICE_PATH, payload)
+
+    def __call__(self, url: str, params=None, timeout=None) -> FakeResponse:
+        path = urlsplit(url).path
+        self.calls.append(path)
+        if self.error is not None:
+            raise self.error
+        return self.routes[path]
+
+
+@pytest.fixture
+def hermes(monkeypatch) -> HermesStub:
+    """Route all `requests.Session.get` calls to a `HermesStub` for the test."""
+    stub = HermesStub()
+    monkeypatch.setattr("requests.Session.get", stub)
+    return stub
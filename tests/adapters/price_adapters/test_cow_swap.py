@@ -7,7 +7,7 @@ from tq_oracle.settings import OracleSettings
 from tq_oracle.settings import Network
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     return OracleSettings(
         vault_address="0xVault",
@@ -22,7 +22,7 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def eth_address(config):
     address = config.assets["ETH"]
     assert address is not None
@@ -30,48 +30,49 @@ def eth_address(config):
 
 
 @pytest.fixture
+def empty_price_data(eth_address):
+    return PriceData(base_asset=eth_address, prices={})
+
+
+@pytest.fixture(scope="session")
 def usdc_address(config):
     address = config.assets["USDC"]
     assert address is not None
     return address
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usdt_address(config):
     address = config.assets["USDT"]
     assert address is not None
     return address
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usds_address(config):
     address = config.assets["USDS"]
     assert address is not None
     return address
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oseth_address(config):
     address = config.assets["OSETH"]
     assert address is not None
     return address
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_returns_empty_prices_on_unsupported_asset(
-    config, eth_address
+    config, empty_price_data
 ):
     adapter = CowSwapAdapter(config)
     unsupported_address = "0xUnsupported"
 
-    result = await adapter.fetch_prices(
-        [unsupported_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([unsupported_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 0
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_raises_on_unsupported_base_asset(config, eth_address):
     adapter = CowSwapAdapter(config)
     unsupported_address = "0xUnsupported"
@@ -88,7 +89,6 @@ def test_oseth_is_skipped(config, oseth_address):
     assert oseth_address.lower() in adapter.skipped_assets
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_returns_previous_prices_on_unsupported_asset(
     config, eth_address
 ):
@@ -102,7 +102,6 @@ async def test_fetch_prices_returns_previous_prices_on_unsupported_asset(
     assert result.prices["0x111"] == 1
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_usdc_integration_with_previous_prices(
     config, eth_address, usdc_address
@@ -119,7 +118,6 @@ async def test_fetch_prices_usdc_integration_with_previous_prices(
     assert price >= 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_usdt_integration_with_previous_prices(
     config, eth_address, usdt_address
@@ -136,15 +134,12 @@ async def test_fetch_prices_usdt_integration_with_previous_prices(
     assert price >= 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_usdc_and_usdt_integration(
-    config, eth_address, usdc_address, usdt_address
+    config, usdc_address, usdt_address, empty_price_data
 ):
     adapter = CowSwapAdapter(config)
-    result = await adapter.fetch_prices(
-        [usdc_address, usdt_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([usdc_address, usdt_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 2
     usdc_price = result.prices[usdc_address]
@@ -155,8 +150,9 @@ async def test_fetch_prices_usdc_and_usdt_integration(
     assert usdt_price >= 0
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_usdt_not_supported_on_testnet(eth_address, usdt_address):
+async def test_fetch_prices_usdt_not_supported_on_testnet(
+    usdt_address, empty_price_data
+):
     testnet_config = OracleSettings(
         vault_address="0xVault",
         oracle_helper_address="0xOracleHelper",
@@ -169,14 +165,11 @@ async def test_fetch_prices_usdt_not_supported_on_testnet(eth_address, usdt_addr
         safe_txn_srvc_api_key=None,
     )
     adapter = CowSwapAdapter(testnet_config)
-    result = await adapter.fetch_prices(
-        [usdt_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([usdt_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_usds_integration_with_previous_prices(
     config, eth_address, usds_address
@@ -193,15 +186,14 @@ async def test_fetch_prices_usds_integration_with_previous_prices(
     assert price >= 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_all_stablecoins_integration(
-    config, eth_address, usdc_address, usdt_address, usds_address
+    config, usdc_address, usdt_address, usds_address, empty_price_data
 ):
     adapter = CowSwapAdapter(config)
     result = await adapter.fetch_prices(
         [usdc_address, usdt_address, usds_address],
-        PriceData(base_asset=eth_address, prices={}),
+        empty_price_data,
     )
     assert isinstance(result, PriceData)
     assert len(result.prices) == 3
@@ -216,8 +208,9 @@ async def test_fetch_prices_all_stablecoins_integration(
     assert usds_price >= 0
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_usds_not_supported_on_testnet(eth_address, usds_address):
+async def test_fetch_prices_usds_not_supported_on_testnet(
+    usds_address, empty_price_data
+):
     testnet_config = OracleSettings(
         vault_address="0xVault",
         oracle_helper_address="0xOracleHelper",
@@ -230,15 +223,12 @@ async def test_fetch_prices_usds_not_supported_on_testnet(eth_address, usds_addr
         safe_txn_srvc_api_key=None,
     )
     adapter = CowSwapAdapter(testnet_config)
-    result = await adapter.fetch_prices(
-        [usds_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([usds_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 0
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_preserves_precision(mocker, config, eth_address):
+async def test_fetch_prices_preserves_precision(mocker, config, empty_price_data):
     adapter = CowSwapAdapter(config)
     test_asset_address = "0xTestAsset"
     high_precision_price_str = "12345.123456789123456789"  # More than float precision
@@ -250,8 +240,7 @@ async def test_fetch_prices_preserves_precision(mocker, config, eth_address):
     )
     mocker.patch.object(adapter, "get_token_decimals", return_value=18)
 
-    prices_accumulator = PriceData(base_asset=eth_address, prices={})
-    result = await adapter.fetch_prices([test_asset_address], prices_accumulator)
+    result = await adapter.fetch_prices([test_asset_address], empty_price_data)
 
     expected_price_wei = int(Decimal(high_precision_price_str) * 10**18)
     # For a token with 18 decimals, price_wei_normalized should be the same as price_wei
@@ -262,8 +251,9 @@ async def test_fetch_prices_preserves_precision(mocker, config, eth_address):
     assert isinstance(result.prices[test_asset_address], int)
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_skips_oseth(mocker, config, eth_address, oseth_address):
+async def test_fetch_prices_skips_oseth(
+    mocker, config, oseth_address, empty_price_data
+):
     adapter = CowSwapAdapter(config)
     mocker.patch.object(
         adapter,
@@ -276,7 +266,6 @@ async def test_fetch_prices_skips_oseth(mocker, config, eth_address, oseth_addre
         side_effect=AssertionError("osETH decimals should not be fetched via CowSwap"),
     )
 
-    prices_accumulator = PriceData(base_asset=eth_address, prices={})
-    result = await adapter.fetch_prices([oseth_address], prices_accumulator)
+    result = await adapter.fetch_prices([oseth_address], empty_price_data)
 
     assert oseth_address not in result.prices
@@ -6,7 +6,7 @@ from tq_oracle.settings import OracleSettings
 from tq_oracle.settings import Network
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     return OracleSettings(
         vault_address="0xVault",
@@ -21,7 +21,7 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def eth_address(config):
     address = config.assets["ETH"]
     assert address is not None
@@ -29,40 +29,40 @@ def eth_address(config):
 
 
 @pytest.fixture
+def empty_price_data(eth_address):
+    return PriceData(base_asset=eth_address, prices={})
+
+
+@pytest.fixture(scope="session")
 def weth_address(config):
     address = config.assets["WETH"]
     assert address is not None
     return address
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oseth_address(config):
     address = config.assets["OSETH"]
     assert address is not None
     return address
 
 
-@pytest.mark.asyncio
-async def test_adapter_name(config):
+def test_adapter_name(config):
     adapter = ETHAdapter(config)
     assert adapter.adapter_name == "eth"
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_returns_empty_prices_on_unsupported_asset(
-    config, eth_address
+    config, empty_price_data
 ):
     adapter = ETHAdapter(config)
     unsupported_address = "0xUnsupported"
 
-    result = await adapter.fetch_prices(
-        [unsupported_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([unsupported_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 0
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_raises_on_unsupported_base_asset(config):
     adapter = ETHAdapter(config)
     unsupported_address = "0xUnsupported"
@@ -72,7 +72,6 @@ async def test_fetch_prices_raises_on_unsupported_base_asset(config):
         )
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_returns_previous_prices_on_unsupported_asset(
     config, eth_address
 ):
@@ -87,34 +86,31 @@ async def test_fetch_prices_returns_previous_prices_on_unsupported_asset(
     assert result.prices["0x111"] == 1
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_eth_returns_one(config, eth_address):
+async def test_fetch_prices_eth_returns_one(config, eth_address, empty_price_data):
     adapter = ETHAdapter(config)
-    result = await adapter.fetch_prices(
-        [eth_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([eth_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 1
     assert result.prices[eth_address] == 10**18
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_weth_returns_one_to_one(config, eth_address, weth_address):
+async def test_fetch_prices_weth_returns_one_to_one(
+    config, weth_address, empty_price_data
+):
     adapter = ETHAdapter(config)
-    result = await adapter.fetch_prices(
-        [weth_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([weth_address], empty_price_data)
     assert isinstance(result, PriceData)
     assert len(result.prices) == 1
     assert result.prices[weth_address] == 10**18
 
 
-@pytest.mark.asyncio
-async def test_fetch_prices_all_three_assets(config, eth_address, weth_address):
+async def test_fetch_prices_all_three_assets(
+    config, eth_address, weth_address, empty_price_data
+):
     adapter = ETHAdapter(config)
     result = await adapter.fetch_prices(
         [eth_address, weth_address],
-        PriceData(base_asset=eth_address, prices={}),
+        empty_price_data,
     )
     assert isinstance(result, PriceData)
     assert len(result.prices) == 2
@@ -122,7 +118,23 @@ async def test_fetch_prices_all_three_assets(config, eth_address, weth_address):
     assert result.prices[weth_address] == 10**18
 
 
-@pytest.mark.asyncio
+async def test_fetch_prices_eth_weth_skip_rpc(
+    mocker, config, eth_address, weth_address, empty_price_data
+):
+    adapter = ETHAdapter(config)
+    mocker.patch.object(
+        adapter,
+        "_get_oseth_price",
+        side_effect=AssertionError("ETH and WETH must not need an RPC call"),
+    )
+
+    result = await adapter.fetch_prices(
+        [eth_address.lower(), weth_address], empty_price_data
+    )
+
+    assert result.prices == {eth_address: 10**18, weth_address: 10**18}
+
+
 async def test_fetch_prices_preserves_existing_prices(
     config, eth_address, weth_address
 ):
@@ -137,9 +149,8 @@ async def test_fetch_prices_preserves_existing_prices(
     assert result.prices[weth_address] == 10**18
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_oseth_uses_native_value(
-    mocker, config, eth_address, oseth_address
+    mocker, config, oseth_address, empty_price_data
 ):
     adapter = ETHAdapter(config)
     mock_price = 987654321
@@ -147,17 +158,14 @@ async def test_fetch_prices_oseth_uses_native_value(
         adapter, "_get_oseth_price", return_value=mock_price
     )
 
-    result = await adapter.fetch_prices(
-        [oseth_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([oseth_address], empty_price_data)
 
     mock_get_oseth_price.assert_called_once()
     assert result.prices[oseth_address] == mock_price
 
 
-@pytest.mark.asyncio
 async def test_fetch_prices_oseth_skipped_when_disabled(
-    mocker, eth_address, oseth_address
+    mocker, oseth_address, empty_price_data
 ):
     config = OracleSettings(
         vault_address="0xVault",
@@ -177,14 +185,11 @@ async def test_fetch_prices_oseth_skipped_when_disabled(
         ),
     )
 
-    result = await adapter.fetch_prices(
-        [oseth_address], PriceData(base_asset=eth_address, prices={})
-    )
+    result = await adapter.fetch_prices([oseth_address], empty_price_data)
 
     assert oseth_address not in result.prices
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_fetch_prices_all_assets_integration(config, eth_address, weth_address):
     adapter = ETHAdapter(config)
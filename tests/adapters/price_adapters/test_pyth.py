@@ -1,10 +1,15 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
+from tq_oracle.adapters.price_adapters.base import PriceData
 from tq_oracle.adapters.price_adapters.pyth import PythAdapter
 from tq_oracle.settings import Network, OracleSettings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     return OracleSettings(
         vault_address="0xVault",
@@ -18,7 +23,7 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def adapter(config):
     return PythAdapter(config)
 
@@ -28,39 +33,187 @@ def test_adapter_name(adapter):
 
 
 class TestScaleTo18:
-    def test_scale_to_18_typical_pyth_expo(self, adapter):
-        result = adapter._scale_to_18(250012345678, -8)
-        assert result == 2500123456780000000000
+    @pytest.mark.parametrize(
+        "value, expo, expected",
+        [
+            (250012345678, -8, 2500123456780000000000),
+            (123, -18, 123),
+            (1, -6, 10**12),
+            (10**20, -20, 10**18),
+            (100, -20, 1),
+            (5, 6, 5 * 10**24),
+        ],
+    )
+    def test_scale_to_18(self, adapter, value, expo, expected):
+        assert adapter._scale_to_18(value, expo) == expected
+
+    @pytest.mark.parametrize(
+        "value, expo, match",
+        [
+            (-12345, -8, "Price value must be non-negative"),
+            (1, 26, "Exponent .* out of supported range"),
+            (1, -256, "Exponent .* out of supported range"),
+        ],
+    )
+    def test_scale_to_18_rejects_invalid_input(self, adapter, value, expo, match):
+        with pytest.raises(ValueError, match=match):
+            adapter._scale_to_18(value, expo)
 
-    def test_scale_to_18_negative_price_rejected(self, adapter):
-        with pytest.raises(ValueError, match="Price value must be non-negative"):
-            adapter._scale_to_18(-12345, -8)
 
-    def test_scale_to_18_expo_out_of_range(self, adapter):
-        with pytest.raises(ValueError, match="Exponent .* out of supported range"):
-            adapter._scale_to_18(1, 26)
+@pytest.mark.parametrize("conf", ["1000000", "3000000"])
+def test_check_confidence_passes_up_to_max_ratio(adapter, conf):
+    price_obj = {"price": "100000000", "conf": conf, "expo": -8}
+    price_18 = 1000000000000000000
+    adapter._check_confidence(price_obj, price_18, "ETH/USD")
 
-        with pytest.raises(ValueError, match="Exponent .* out of supported range"):
-            adapter._scale_to_18(1, -256)
 
+@pytest.mark.parametrize(
+    "price_obj, price_18, match",
+    [
+        (
+            {"price": "100000000", "conf": "5000000", "expo": -8},
+            1000000000000000000,
+            r"confidence ratio .* exceeds maximum",
+        ),
+        (
+            {"price": "0", "conf": "1000000", "expo": -8},
+            0,
+            "price is zero",
+        ),
+    ],
+)
+def test_check_confidence_rejects(adapter, price_obj, price_18, match):
+    with pytest.raises(ValueError, match=match):
+        adapter._check_confidence(price_obj, price_18, "ETH/USD")
 
-def test_check_confidence_passes_with_low_confidence(adapter):
-    price_obj = {"price": "100000000", "conf": "1000000", "expo": -8}
-    price_18 = 1000000000000000000
-    adapter._check_confidence(price_obj, price_18, "ETH/USD")
 
+async def test_sessions_are_per_thread_until_closed(config, hermes):
+    adapter = PythAdapter(config)
+    hermes.respond_discovery([])
+    url = f"{adapter.hermes_endpoint}/v2/price_feeds"
 
-def test_check_confidence_fails_with_high_confidence(adapter):
-    price_obj = {"price": "100000000", "conf": "5000000", "expo": -8}
-    price_18 = 1000000000000000000
+    await adapter._http_get(url)
+    await adapter._http_get(url)
+    assert len(hermes.calls) == 2
+    assert adapter._sessions
 
-    with pytest.raises(ValueError, match=r"confidence ratio .* exceeds maximum"):
-        adapter._check_confidence(price_obj, price_18, "ETH/USD")
+    session = adapter._get_session()
+    assert adapter._get_session() is session
+    assert await asyncio.to_thread(adapter._get_session) is not session
 
+    adapter.close()
+    assert adapter._sessions == []
+    assert adapter._get_session() is not session
 
-def test_check_confidence_fails_on_zero_price(adapter):
-    price_obj = {"price": "0", "conf": "1000000", "expo": -8}
-    price_18 = 0
 
-    with pytest.raises(ValueError, match="price is zero"):
-        adapter._check_confidence(price_obj, price_18, "ETH/USD")
+async def test_resolve_feed_id_discovers_each_pair_once(config, hermes):
+    adapter = PythAdapter(config)
+    hermes.respond_discovery(
+        [
+            {
+                "id": "ab" * 32,
+                "type": "derived",
+                "attributes": {"base": "ETH", "quote_currency": "USD"},
+            }
+        ]
+    )
+
+    first, second = await asyncio.gather(
+        adapter._resolve_feed_id("ETH"), adapter._resolve_feed_id("eth")
+    )
+    third = await adapter._resolve_feed_id("ETH")
+
+    assert first == second == third == "0x" + "ab" * 32
+    assert len(hermes.calls) == 1
+
+
+async def test_fetch_prices_batches_all_feeds_into_one_request(config, hermes):
+    adapter = PythAdapter(config)
+    feed_ids = {"ETH": "e1" * 32, "USDC": "c1" * 32, "USDT": "d1" * 32}
+    usd_prices = {"ETH": "300000000000", "USDC": "100000000", "USDT": "100000000"}
+    now = int(time.time())
+    hermes.respond_discovery(
+        [
+            {
+                "id": feed_id,
+                "type": "derived",
+                "attributes": {"base": symbol, "quote_currency": "USD"},
+            }
+            for symbol, feed_id in feed_ids.items()
+        ]
+    )
+    hermes.respond_latest_prices(
+        {
+            "parsed": [
+                {
+                    "id": feed_id,
+                    "price": {
+                        "price": usd_prices[symbol],
+                        "expo": -8,
+                        "conf": "0",
+                        "publish_time": now,
+                    },
+                }
+                for symbol, feed_id in feed_ids.items()
+            ]
+        }
+    )
+
+    result = await adapter.fetch_prices(
+        [config.assets["USDC"], config.assets["USDT"]],
+        PriceData(base_asset=config.assets["ETH"], prices={}),
+    )
+
+    assert result.prices == {
+        config.assets["USDC"]: 10**18 // 3000,
+        config.assets["USDT"]: 10**18 // 3000,
+    }
+    assert hermes.calls.count("/v2/updates/price/latest") == 1
+
+
+async def test_fetch_prices_discovers_base_and_assets_concurrently(
+    config, hermes, monkeypatch
+):
+    adapter = PythAdapter(config)
+    feed_ids = {"ETH": "e1" * 32, "USDC": "c1" * 32}
+    hermes.respond_discovery(
+        [
+            {
+                "id": feed_id,
+                "type": "derived",
+                "attributes": {"base": symbol, "quote_currency": "USD"},
+            }
+            for symbol, feed_id in feed_ids.items()
+        ]
+    )
+    hermes.respond_latest_prices({"parsed": []})
+
+    # Each discovery request blocks until the other has started, so
+    # serialized requests break the barrier instead of both getting through.
+    discovery_started = threading.Barrier(len(feed_ids), timeout=1.0)
+    counter_lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    def get(_session, url, params=None, timeout=None):
+        nonlocal in_flight, max_in_flight
+        with counter_lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if url.endswith("/v2/price_feeds"):
+                discovery_started.wait()
+            return hermes(url, params=params, timeout=timeout)
+        finally:
+            with counter_lock:
+                in_flight -= 1
+
+    monkeypatch.setattr("requests.Session.get", get)
+
+    with pytest.raises(ValueError, match="not in Pyth response"):
+        await adapter.fetch_prices(
+            [config.assets["USDC"]],
+            PriceData(base_asset=config.assets["ETH"], prices={}),
+        )
+
+    assert hermes.calls.count("/v2/price_feeds") == 2
+    assert max_in_flight == 2
@@ -1,13 +1,14 @@
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch
-import time
 
+from tq_oracle.adapters.price_adapters import pyth
 from tq_oracle.adapters.price_validators.pyth import PythValidator
 from tq_oracle.adapters.price_adapters.base import PriceData
 from tq_oracle.settings import OracleSettings, Network
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     return OracleSettings(
         vault_address="0xVault",
@@ -32,48 +33,50 @@ def validator(config):
 
 
 @pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the clock the Pyth adapter uses for staleness checks.
+
+    Swaps the adapter module's ``time`` reference for a stub so the stdlib
+    ``time.time`` stays untouched for the rest of the process.
+    """
+    now = 1_700_000_000
+    monkeypatch.setattr(pyth, "time", SimpleNamespace(time=lambda: float(now)))
+    return now
+
+
+@pytest.fixture(scope="session")
 def eth_address(config):
     address = config.assets["ETH"]
     assert address is not None
     return address
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usdc_address(config):
     address = config.assets["USDC"]
     assert address is not None
     return address
 
 
-def _make_mock_response(payload: dict | list) -> MagicMock:
-    response = MagicMock()
-    response.json.return_value = payload
-    response.raise_for_status.return_value = None
-    return response
-
+_ETH_FEED_ID = "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"
+_USDC_FEED_ID = "eaa020c61cc479712813461ce153894a96a6c00b21ed0cfc2798d1f9a9e9c94a"
 
-def _default_discovery_payload() -> list[dict]:
-    return [
-        {
-            "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
-            "type": "derived",
-            "attributes": {"base": "ETH", "quote_currency": "USD"},
-        },
-        {
-            "id": "eaa020c61cc479712813461ce153894a96a6c00b21ed0cfc2798d1f9a9e9c94a",
-            "type": "derived",
-            "attributes": {"base": "USDC", "quote_currency": "USD"},
-        },
-    ]
+_ETH_DISCOVERY_ENTRY = {
+    "id": _ETH_FEED_ID,
+    "type": "derived",
+    "attributes": {"base": "ETH", "quote_currency": "USD"},
+}
+_USDC_DISCOVERY_ENTRY = {
+    "id": _USDC_FEED_ID,
+    "type": "derived",
+    "attributes": {"base": "USDC", "quote_currency": "USD"},
+}
 
+_DEFAULT_DISCOVERY = [_ETH_DISCOVERY_ENTRY, _USDC_DISCOVERY_ENTRY]
 
-def _patch_requests(mock_discovery: MagicMock, mock_price: MagicMock):
-    def _mock(url: str, params=None, timeout=None):
-        if url.endswith("/v2/price_feeds"):
-            return mock_discovery
-        return mock_price
-
-    return _mock
+# USDC priced in ETH with ETH at $3000, and a price 50% away from it.
+_USDC_IN_ETH = 10**18 // 3000
+_USDC_IN_ETH_OFF = 10**18 // 2000
 
 
 def test_staleness_threshold(validator):
@@ -109,11 +112,34 @@ def test_calculate_deviation_extreme_movement_and_zero_actual(validator):
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "reference, actual",
+    [
+        (1000, 1000),
+        (1000, 1100),
+        (1000, 900),
+        (1000, 1010),
+        (1000, 1005),
+        (10**18, 95 * 10**16),
+    ],
+)
+@pytest.mark.parametrize("tolerance_pct", [0.5, 1.0, 5.0])
+def test_exceeds_deviation_matches_percentage(
+    validator, reference, actual, tolerance_pct
+):
+    """The integer threshold check agrees with the float deviation percentage."""
+    expected = (
+        validator._calculate_price_deviation_percentage(reference, actual)
+        > tolerance_pct
+    )
+    ratio = validator._tolerance_ratio(tolerance_pct)
+
+    assert validator._exceeds_deviation(reference, actual, ratio) is expected
+
+
 async def test_validate_prices_disabled(config, eth_address, usdc_address):
     """Test that validation passes when Pyth is disabled."""
-    config.pyth_enabled = False
-    validator = PythValidator(config)
+    validator = PythValidator(config.model_copy(update={"pyth_enabled": False}))
 
     price_data = PriceData(
         base_asset=eth_address,
@@ -126,125 +152,111 @@ async def test_validate_prices_disabled(config, eth_address, usdc_address):
     assert "disabled" in result.message.lower()
 
 
-@pytest.mark.asyncio
-async def test_validate_prices_with_mocked_pyth(config, eth_address, usdc_address):
+async def test_validate_prices_with_mocked_pyth(
+    hermes, config, eth_address, usdc_address, frozen_now
+):
     """Test validation with mocked HTTP response."""
     validator = PythValidator(config)
 
-    current_time = int(time.time())
-
     # Mock HTTP response
     mock_response_data = {
         "parsed": [
             {
-                "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
+                "id": _ETH_FEED_ID,
                 "price": {
                     "price": "300000000000",
                     "expo": -8,
                     "conf": "1000000000",
-                    "publish_time": current_time,
+                    "publish_time": frozen_now,
                 },
             },
             {
-                "id": "eaa020c61cc479712813461ce153894a96a6c00b21ed0cfc2798d1f9a9e9c94a",
+                "id": _USDC_FEED_ID,
                 "price": {
                     "price": "100000000",
                     "expo": -8,
                     "conf": "1000000",
-                    "publish_time": current_time,
+                    "publish_time": frozen_now,
                 },
             },
         ]
     }
 
-    mock_price_response = _make_mock_response(mock_response_data)
-    mock_discovery_response = _make_mock_response(_default_discovery_payload())
+    hermes.respond_discovery(_DEFAULT_DISCOVERY)
+    hermes.respond_latest_prices(mock_response_data)
 
-    with patch(
-        "requests.get",
-        side_effect=_patch_requests(mock_discovery_response, mock_price_response),
-    ):
-        # Oracle price: USDC is ~1/3000 ETH (since ETH is $3000 and USDC is $1)
-        price_data = PriceData(
-            base_asset=eth_address,
-            prices={usdc_address: int((1 / 3000) * 1e18)},
-        )
+    # Oracle price: USDC is ~1/3000 ETH (since ETH is $3000 and USDC is $1)
+    price_data = PriceData(
+        base_asset=eth_address,
+        prices={usdc_address: _USDC_IN_ETH},
+    )
 
-        result = await validator.validate_prices(price_data)
+    result = await validator.validate_prices(price_data)
 
-        assert result.passed
-        assert "within acceptable deviation" in result.message.lower()
+    assert result.passed
+    assert "within acceptable deviation" in result.message.lower()
 
 
-@pytest.mark.asyncio
 async def test_validate_prices_fails_on_excessive_deviation(
-    config, eth_address, usdc_address
+    hermes, config, eth_address, usdc_address, frozen_now
 ):
     """Test that validation fails when price deviation exceeds threshold."""
     validator = PythValidator(config)
 
-    current_time = int(time.time())
-
     # Mock HTTP response
     mock_response_data = {
         "parsed": [
             {
-                "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
+                "id": _ETH_FEED_ID,
                 "price": {
                     "price": "300000000000",
                     "expo": -8,
                     "conf": "1000000000",
-                    "publish_time": current_time,
+                    "publish_time": frozen_now,
                 },
             },
             {
-                "id": "eaa020c61cc479712813461ce153894a96a6c00b21ed0cfc2798d1f9a9e9c94a",
+                "id": _USDC_FEED_ID,
                 "price": {
                     "price": "100000000",
                     "expo": -8,
                     "conf": "1000000",
-                    "publish_time": current_time,
+                    "publish_time": frozen_now,
                 },
             },
         ]
     }
 
-    mock_price_response = _make_mock_response(mock_response_data)
-    mock_discovery_response = _make_mock_response(_default_discovery_payload())
+    hermes.respond_discovery(_DEFAULT_DISCOVERY)
+    hermes.respond_latest_prices(mock_response_data)
 
-    with patch(
-        "requests.get",
-        side_effect=_patch_requests(mock_discovery_response, mock_price_response),
-    ):
-        # Oracle price: Intentionally wrong - USDC price way off
-        price_data = PriceData(
-            base_asset=eth_address,
-            prices={usdc_address: int((1 / 2000) * 1e18)},  # 50% deviation
-        )
+    # Oracle price: Intentionally wrong - USDC price way off
+    price_data = PriceData(
+        base_asset=eth_address,
+        prices={usdc_address: _USDC_IN_ETH_OFF},  # 50% deviation
+    )
 
-        result = await validator.validate_prices(price_data)
+    result = await validator.validate_prices(price_data)
 
-        assert not result.passed
-        assert (
-            "failure threshold" in result.message.lower()
-            or "off" in result.message.lower()
-        )
+    assert not result.passed
+    assert (
+        "failure threshold" in result.message.lower() or "off" in result.message.lower()
+    )
 
 
-@pytest.mark.asyncio
 async def test_validate_prices_handles_stale_eth_price(
-    config, eth_address, usdc_address
+    hermes, config, eth_address, usdc_address, frozen_now
 ):
     """Test that validation fails when ETH/USD price is stale."""
     validator = PythValidator(config)
 
     # Make the price stale (published 120 seconds ago, staleness threshold is 60s)
-    stale_time = int(time.time()) - 120
+    stale_time = frozen_now - 120
 
     mock_response_data = {
         "parsed": [
             {
-                "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
+                "id": _ETH_FEED_ID,
                 "price": {
                     "price": "3000",
                     "expo": 0,
@@ -255,79 +267,50 @@ async def test_validate_prices_handles_stale_eth_price(
         ]
     }
 
-    mock_price_response = _make_mock_response(mock_response_data)
-    mock_discovery_response = _make_mock_response(_default_discovery_payload())
+    hermes.respond_discovery(_DEFAULT_DISCOVERY)
+    hermes.respond_latest_prices(mock_response_data)
 
-    with patch(
-        "requests.get",
-        side_effect=_patch_requests(mock_discovery_response, mock_price_response),
-    ):
-        price_data = PriceData(
-            base_asset=eth_address,
-            prices={usdc_address: int((1 / 3000) * 1e18)},
-        )
+    price_data = PriceData(
+        base_asset=eth_address,
+        prices={usdc_address: _USDC_IN_ETH},
+    )
 
-        result = await validator.validate_prices(price_data)
+    result = await validator.validate_prices(price_data)
 
-        assert not result.passed
-        assert "stale" in result.message.lower()
+    assert not result.passed
+    assert "stale" in result.message.lower()
 
 
-@pytest.mark.asyncio
-async def test_validate_prices_handles_api_error(config, eth_address, usdc_address):
+async def test_validate_prices_handles_api_error(
+    hermes, config, eth_address, usdc_address
+):
     """Test that validation handles API errors gracefully."""
     validator = PythValidator(config)
 
     # Mock an exception during the HTTP call
-    with patch("requests.get", side_effect=Exception("API Error")):
-        price_data = PriceData(
-            base_asset=eth_address,
-            prices={usdc_address: int((1 / 3000) * 1e18)},
-        )
+    hermes.error = Exception("API Error")
 
-        result = await validator.validate_prices(price_data)
+    price_data = PriceData(
+        base_asset=eth_address,
+        prices={usdc_address: _USDC_IN_ETH},
+    )
 
-        assert not result.passed
-        assert result.retry_recommended
+    result = await validator.validate_prices(price_data)
 
+    assert not result.passed
+    assert result.retry_recommended
 
-@pytest.mark.asyncio
-async def test_validate_prices_passes_with_empty_prices(validator, eth_address):
-    """Test that validation passes with empty price data."""
-    current_time = int(time.time())
 
-    mock_response_data = {
-        "parsed": [
-            {
-                "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
-                "price": {
-                    "price": "3000",
-                    "expo": 0,
-                    "conf": "10",
-                    "publish_time": current_time,
-                },
-            },
-        ]
-    }
-
-    mock_price_response = _make_mock_response(mock_response_data)
-    mock_discovery_response = _make_mock_response(
-        [
-            {
-                "id": "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
-                "type": "derived",
-                "attributes": {"base": "ETH", "quote_currency": "USD"},
-            }
-        ]
-    )
-
-    with patch(
-        "requests.get",
-        side_effect=_patch_requests(mock_discovery_response, mock_price_response),
-    ):
-        price_data = PriceData(base_asset=eth_address, prices={})
+@pytest.mark.parametrize("include_base", [False, True])
+async def test_validate_prices_passes_with_empty_prices(
+    hermes, validator, eth_address, include_base
+):
+    """Test that validation passes without calling Pyth when nothing needs checking."""
+    prices = {eth_address: 10**18} if include_base else {}
+    price_data = PriceData(base_asset=eth_address, prices=prices)
 
-        result = await validator.validate_prices(price_data)
+    result = await validator.validate_prices(price_data)
 
-        assert result.passed
-        assert "within acceptable deviation" in result.message.lower()
+    assert result.passed
+    assert "within acceptable deviation" in result.message.lower()
+    assert hermes.calls == []
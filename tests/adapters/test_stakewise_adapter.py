@@ -1,5 +1,5 @@
 from types import SimpleNamespace
-from typing import cast
+from typing import Any, cast
 
 import pytest
 
@@ -68,10 +68,15 @@ def dummy_web3(monkeypatch):
         "tq_oracle.adapters.asset_adapters.stakewise.Web3",
         DummyWeb3,
     )
+    monkeypatch.setattr(
+        "tq_oracle.adapters.asset_adapters.stakewise.checksum_address",
+        DummyWeb3.to_checksum_address,
+    )
 
 
-def _build_adapter(dummy_web3) -> StakeWiseAdapter:
-    config = OracleSettings(
+@pytest.fixture(scope="module")
+def stakewise_config() -> OracleSettings:
+    return OracleSettings(
         vault_rpc="http://localhost",
         block_number=1,
         vault_address="0x0000000000000000000000000000000000000001",
@@ -83,12 +88,14 @@ def _build_adapter(dummy_web3) -> StakeWiseAdapter:
             }
         },
     )
-    return StakeWiseAdapter(config)
 
 
-@pytest.mark.asyncio
-async def test_stakewise_adapter_no_exit_queue(dummy_web3):
-    adapter = _build_adapter(dummy_web3)
+@pytest.fixture()
+def adapter(dummy_web3, stakewise_config) -> StakeWiseAdapter:
+    return StakeWiseAdapter(stakewise_config)
+
+
+async def test_stakewise_adapter_no_exit_queue(adapter):
 
     async def no_tickets(_self, _context, _user):
         return []
@@ -135,9 +142,7 @@ async def test_stakewise_adapter_no_exit_queue(dummy_web3):
     )
 
 
-@pytest.mark.asyncio
-async def test_stakewise_adapter_exit_queue_direct_receiver(dummy_web3):
-    adapter = _build_adapter(dummy_web3)
+async def test_stakewise_adapter_exit_queue_direct_receiver(adapter):
 
     async def tickets(_self, _context, _user):
         return [
@@ -204,3 +209,67 @@ async def test_stakewise_adapter_exit_queue_direct_receiver(dummy_web3):
         asset.asset_address == adapter.os_token_address and asset.amount == -4
         for asset in assets
     )
+
+
+async def test_scan_exit_queue_tickets_queries_every_block_range(adapter):
+    calls: list[tuple[int, int]] = []
+
+    class RecordingEvent:
+        def get_logs(self, from_block, to_block, argument_filters):
+            calls.append((from_block, to_block))
+            if from_block <= 12 <= to_block:
+                return [
+                    {
+                        "args": {
+                            "positionTicket": 1,
+                            "shares": 5,
+                            "receiver": "0xuser",
+                        },
+                        "blockNumber": 12,
+                        "logIndex": 0,
+                    }
+                ]
+            return []
+
+    async def direct_rpc(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    adapter._rpc = direct_rpc.__get__(adapter, StakeWiseAdapter)
+    adapter.block_identifier = 25
+    adapter._exit_log_chunk = 10
+    adapter._exit_queue_start_block = 0
+    context = StakewiseVaultContext(
+        address="0xvault",
+        contract=cast(Contract, SimpleNamespace()),
+        exit_events=[cast(Any, RecordingEvent())],
+    )
+
+    tickets = await adapter._scan_exit_queue_tickets(context, "0xuser")
+
+    assert sorted(calls) == [(0, 5), (6, 15), (16, 25)]
+    assert [(t.ticket, t.block_number, t.timestamp) for t in tickets] == [(1, 12, 0)]
+
+
+async def test_convert_to_assets_is_memoized_per_vault(adapter):
+    conversions: list[int] = []
+
+    def convert(shares):
+        conversions.append(shares)
+        return _Call(shares * 2)
+
+    async def direct_rpc(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    adapter._rpc = direct_rpc.__get__(adapter, StakeWiseAdapter)
+    contract = cast(
+        Contract,
+        SimpleNamespace(functions=SimpleNamespace(convertToAssets=convert)),
+    )
+    vault_a = StakewiseVaultContext(address="0xa", contract=contract, exit_events=[])
+    vault_b = StakewiseVaultContext(address="0xb", contract=contract, exit_events=[])
+
+    assert await adapter._convert_to_assets(vault_a, 5) == 10
+    assert await adapter._convert_to_assets(vault_a, 5) == 10
+    assert await adapter._convert_to_assets(vault_b, 5) == 10
+
+    assert conversions == [5, 5]
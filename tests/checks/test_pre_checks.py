@@ -1,5 +1,3 @@
-from unittest.mock import AsyncMock, MagicMock, patch
-
 import pytest
 
 from tq_oracle.adapters.check_adapters.base import CheckResult
@@ -7,7 +5,7 @@ from tq_oracle.checks.pre_checks import PreCheckError, run_pre_checks
 from tq_oracle.settings import OracleSettings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """Minimal config for testing."""
     return OracleSettings(
@@ -21,80 +19,80 @@ def config():
     )
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.checks.pre_checks.CHECK_ADAPTERS")
-async def test_no_errors_when_all_checks_pass(mock_adapters, config):
-    """Should not raise when all adapters return passing results."""
-    mock_adapter1 = MagicMock()
-    mock_adapter1.name = "Test Check 1"
-    mock_adapter1.run_check = AsyncMock(
-        return_value=CheckResult(passed=True, message="Check 1 passed")
-    )
+_CHECK_1_PASSED = CheckResult(passed=True, message="Check 1 passed")
+_CHECK_2_PASSED = CheckResult(passed=True, message="Check 2 passed")
+_ISSUE_DETECTED = CheckResult(
+    passed=False, message="Check failed: issue detected", retry_recommended=False
+)
+_ALREADY_PUBLISHED = CheckResult(
+    passed=False,
+    message="Report already published for vault 0xVAULT",
+    retry_recommended=False,
+)
 
-    mock_adapter2 = MagicMock()
-    mock_adapter2.name = "Test Check 2"
-    mock_adapter2.run_check = AsyncMock(
-        return_value=CheckResult(passed=True, message="Check 2 passed")
-    )
 
-    mock_adapters.__iter__.return_value = [
-        lambda config: mock_adapter1,
-        lambda config: mock_adapter2,
-    ]
+class _StubCheck:
+    """Check adapter double that returns a fixed result or raises."""
 
-    # Should not raise
-    await run_pre_checks(config)
+    def __init__(
+        self,
+        name: str,
+        result: CheckResult | None = None,
+        error: Exception | None = None,
+    ):
+        self.name = name
+        self._result = result
+        self._error = error
 
+    async def run_check(self) -> CheckResult | None:
+        if self._error is not None:
+            raise self._error
+        return self._result
 
-@pytest.mark.asyncio
-@patch("tq_oracle.checks.pre_checks.CHECK_ADAPTERS")
-async def test_raises_when_check_fails(mock_adapters, config):
-    """Should raise PreCheckError when any adapter returns failing result."""
-    mock_adapter = MagicMock()
-    mock_adapter.name = "Failing Check"
-    mock_adapter.run_check = AsyncMock(
-        return_value=CheckResult(
-            passed=False,
-            message="Check failed: issue detected",
-            retry_recommended=False,
+
+@pytest.fixture
+def use_checks(monkeypatch):
+    """Replace the registered check adapters with the given stubs."""
+
+    def install(*checks: _StubCheck) -> None:
+        monkeypatch.setattr(
+            "tq_oracle.checks.pre_checks.CHECK_ADAPTERS",
+            [lambda config, check=check: check for check in checks],
         )
+
+    return install
+
+
+async def test_no_errors_when_all_checks_pass(use_checks, config):
+    """Should not raise when all adapters return passing results."""
+    use_checks(
+        _StubCheck("Test Check 1", _CHECK_1_PASSED),
+        _StubCheck("Test Check 2", _CHECK_2_PASSED),
     )
 
-    mock_adapters.__iter__.return_value = [lambda config: mock_adapter]
+    # Should not raise
+    await run_pre_checks(config)
+
+
+async def test_raises_when_check_fails(use_checks, config):
+    """Should raise PreCheckError when any adapter returns failing result."""
+    use_checks(_StubCheck("Failing Check", _ISSUE_DETECTED))
 
     with pytest.raises(PreCheckError, match="Pre-checks failed"):
         await run_pre_checks(config)
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.checks.pre_checks.CHECK_ADAPTERS")
-async def test_includes_failure_message_in_error(mock_adapters, config):
+async def test_includes_failure_message_in_error(use_checks, config):
     """Error message should include the check failure message."""
-    mock_adapter = MagicMock()
-    mock_adapter.name = "Test Check"
-    mock_adapter.run_check = AsyncMock(
-        return_value=CheckResult(
-            passed=False,
-            message="Report already published for vault 0xVAULT",
-            retry_recommended=False,
-        )
-    )
-
-    mock_adapters.__iter__.return_value = [lambda config: mock_adapter]
+    use_checks(_StubCheck("Test Check", _ALREADY_PUBLISHED))
 
     with pytest.raises(PreCheckError, match="already published"):
         await run_pre_checks(config)
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.checks.pre_checks.CHECK_ADAPTERS")
-async def test_handles_adapter_exception(mock_adapters, config):
+async def test_handles_adapter_exception(use_checks, config):
     """Should raise PreCheckError when adapter raises exception."""
-    mock_adapter = MagicMock()
-    mock_adapter.name = "Exception Check"
-    mock_adapter.run_check = AsyncMock(side_effect=RuntimeError("Adapter error"))
-
-    mock_adapters.__iter__.return_value = [lambda config: mock_adapter]
+    use_checks(_StubCheck("Exception Check", error=RuntimeError("Adapter error")))
 
     with pytest.raises(PreCheckError, match="Pre-checks failed"):
         await run_pre_checks(config)
@@ -25,42 +25,51 @@ def test_sanitize_adapter_kwargs_drops_empty_collections():
     }
 
 
-def test_process_adapter_results_raises_on_adapter_failure():
+@pytest.mark.parametrize(
+    "tasks_info, results, match",
+    [
+        pytest.param(
+            [("idle_balances", None), ("stakewise", None)],
+            (
+                [AssetData(asset_address="0xToken1", amount=100)],
+                ConnectionError("RPC connection failed"),
+            ),
+            r"Failed to collect assets from 1 adapter\(s\): stakewise",
+            id="single_failure",
+        ),
+        pytest.param(
+            [
+                ("idle_balances", None),
+                ("stakewise", None),
+                ("custom_adapter", None),
+            ],
+            (
+                ConnectionError("RPC connection failed"),
+                [AssetData(asset_address="0xToken1", amount=100)],
+                ValueError("Invalid config"),
+            ),
+            r"Failed to collect assets from 2 adapter\(s\): idle_balances, custom_adapter",
+            id="multiple_failures",
+        ),
+        pytest.param(
+            [
+                ("0xSubvault1", None, "stakewise"),
+                ("0xSubvault2", None, "custom"),
+            ],
+            (
+                [AssetData(asset_address="0xToken1", amount=100)],
+                ValueError("Adapter error"),
+            ),
+            r"custom \(subvault 0xSubvault2\)",
+            id="subvault_in_error",
+        ),
+    ],
+)
+def test_process_adapter_results_raises_on_adapter_failures(tasks_info, results, match):
     log = logging.getLogger("test")
-    tasks_info = [
-        ("idle_balances", None),
-        ("stakewise", None),
-    ]
-    results = (
-        [AssetData(asset_address="0xToken1", amount=100)],
-        ConnectionError("RPC connection failed"),
-    )
     asset_data = []
 
-    with pytest.raises(
-        ValueError, match=r"Failed to collect assets from 1 adapter\(s\): stakewise"
-    ):
-        _process_adapter_results(tasks_info, results, asset_data, log)
-
-
-def test_process_adapter_results_raises_on_multiple_failures():
-    log = logging.getLogger("test")
-    tasks_info = [
-        ("idle_balances", None),
-        ("stakewise", None),
-        ("custom_adapter", None),
-    ]
-    results = (
-        ConnectionError("RPC connection failed"),
-        [AssetData(asset_address="0xToken1", amount=100)],
-        ValueError("Invalid config"),
-    )
-    asset_data = []
-
-    with pytest.raises(
-        ValueError,
-        match=r"Failed to collect assets from 2 adapter\(s\): idle_balances, custom_adapter",
-    ):
+    with pytest.raises(ValueError, match=match):
         _process_adapter_results(tasks_info, results, asset_data, log)
 
 
@@ -81,19 +90,3 @@ def test_process_adapter_results_succeeds_when_all_adapters_work():
     assert len(asset_data) == 2
     assert asset_data[0][0].asset_address == "0xToken1"
     assert asset_data[1][0].asset_address == "0xToken2"
-
-
-def test_process_adapter_results_includes_subvault_in_error():
-    log = logging.getLogger("test")
-    tasks_info = [
-        ("0xSubvault1", None, "stakewise"),
-        ("0xSubvault2", None, "custom"),
-    ]
-    results = (
-        [AssetData(asset_address="0xToken1", amount=100)],
-        ValueError("Adapter error"),
-    )
-    asset_data = []
-
-    with pytest.raises(ValueError, match=r"custom \(subvault 0xSubvault2\)"):
-        _process_adapter_results(tasks_info, results, asset_data, log)
@@ -58,7 +58,6 @@ def test_encode_asset_prices_overwrites_base_asset_to_zero():
     assert prices_dict[ETH_ASSET] == 0
 
 
-@pytest.mark.asyncio
 async def test_derive_final_prices_excludes_tvl_only_assets(monkeypatch):
     captured_asset_prices: dict[str, list[tuple[str, int]]] = {}
 
@@ -115,7 +114,6 @@ async def test_derive_final_prices_excludes_tvl_only_assets(monkeypatch):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_get_prices_d18_integration_via_derive_final_prices():
     provider = "https://eth.drpc.org"
     vault = "0x277C6A642564A91ff78b008022D65683cEE5CCC5"
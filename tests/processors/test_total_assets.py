@@ -144,6 +144,12 @@ def test_calculate_total_assets_invalid_prices_raises():
             {"0xA": 2 * 10**18, "0xB": 100 * 10**18, "0xC": 1 * 10**18},
             25,
         ),
+        (
+            "fractional values truncate per asset",
+            {"0xA": 1, "0xB": 1},
+            {"0xA": 10**18 // 2, "0xB": 10**18 // 2},
+            0,
+        ),
     ],
 )
 def test_calculate_total_assets_scenarios(test_name, assets, prices, expected_total):
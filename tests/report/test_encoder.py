@@ -1,5 +1,7 @@
 import pytest
+from web3 import Web3
 
+from tq_oracle.abi import load_oracle_abi
 from tq_oracle.report.encoder import encode_submit_reports
 from tq_oracle.report.generator import OracleReport
 
@@ -9,7 +11,17 @@ def sample_oracle_address() -> str:
     return "0x1234567890123456789012345678901234567890"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def oracle_contract():
+    """IOracle contract used to decode and re-encode calldata in assertions."""
+    w3 = Web3()
+    return w3.eth.contract(
+        address=w3.to_checksum_address("0x1234567890123456789012345678901234567890"),
+        abi=load_oracle_abi(),
+    )
+
+
+@pytest.fixture(scope="module")
 def sample_report() -> OracleReport:
     return OracleReport(
         vault_address="0xaaa1111111111111111111111111111111111111",
@@ -28,7 +40,7 @@ def sample_report() -> OracleReport:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_empty_report() -> OracleReport:
     return OracleReport(
         vault_address="0xaaa1111111111111111111111111111111111111",
@@ -67,10 +79,8 @@ def test_encode_submit_reports_empty_report(
     assert function_selector == "8f88cbfb"
 
 
-def test_base_asset_is_first_in_reports_array():
+def test_base_asset_is_first_in_reports_array(oracle_contract):
     """Verify that the base asset is always first in the reports array."""
-    from web3 import Web3
-
     # Create a report where base asset would NOT be first numerically
     # 0xddd... > 0xccc... > 0xbbb... when sorted numerically
     # But we set base_asset to 0xddd..., so it should come first
@@ -93,27 +103,36 @@ def test_base_asset_is_first_in_reports_array():
     oracle_address = "0x1234567890123456789012345678901234567890"
     to_address, calldata = encode_submit_reports(oracle_address, report)
 
-    # Decode the calldata to verify ordering
-    w3 = Web3()
-    from tq_oracle.abi import load_oracle_abi
-
-    abi = load_oracle_abi()
-    contract = w3.eth.contract(address=w3.to_checksum_address(oracle_address), abi=abi)
-
-    # Decode the transaction data
-    func_obj, params = contract.decode_function_input(calldata)
+    # Decode the transaction data to verify ordering
+    func_obj, params = oracle_contract.decode_function_input(calldata)
     reports_array = params["reports"]
 
     # Verify base asset is first
     assert len(reports_array) == 3
     # Reports are dicts with 'asset' and 'priceD18' keys
-    assert reports_array[0]["asset"] == w3.to_checksum_address(
+    assert reports_array[0]["asset"] == Web3.to_checksum_address(
         "0xddd4444444444444444444444444444444444444"
     )
     # Verify other assets are in numerical order
-    assert reports_array[1]["asset"] == w3.to_checksum_address(
+    assert reports_array[1]["asset"] == Web3.to_checksum_address(
         "0xbbb2222222222222222222222222222222222222"
     )
-    assert reports_array[2]["asset"] == w3.to_checksum_address(
+    assert reports_array[2]["asset"] == Web3.to_checksum_address(
         "0xccc3333333333333333333333333333333333333"
     )
+
+
+def test_encode_submit_reports_matches_contract_abi_encoding(
+    oracle_contract, sample_oracle_address: str, sample_report: OracleReport
+):
+    """Direct eth_abi encoding must equal web3's encoding from the IOracle ABI."""
+    _, calldata = encode_submit_reports(sample_oracle_address, sample_report)
+
+    func_obj, params = oracle_contract.decode_function_input(calldata)
+    expected = oracle_contract.encode_abi(
+        abi_element_identifier="submitReports",
+        args=[[(r["asset"], r["priceD18"]) for r in params["reports"]]],
+    )
+
+    assert func_obj.fn_name == "submitReports"
+    assert calldata == bytes.fromhex(expected.removeprefix("0x"))
@@ -1,11 +1,10 @@
-import pytest
+from dataclasses import fields
 
 from tq_oracle.processors.asset_aggregator import AggregatedAssets
 from tq_oracle.processors.oracle_helper import FinalPrices
 from tq_oracle.report.generator import OracleReport, generate_report
 
 
-@pytest.mark.asyncio
 async def test_generate_report_creates_correct_structure():
     """Report should correctly map vault address, assets, and prices."""
     vault_address = "0xVault123"
@@ -29,7 +28,6 @@ async def test_generate_report_creates_correct_structure():
     assert report.final_prices == {"0xA": 10**18, "0xB": 2 * 10**18}
 
 
-@pytest.mark.asyncio
 async def test_generate_report_with_empty_data():
     """Report should handle empty assets and prices without error."""
     vault_address = "0xEmptyVault"
@@ -48,7 +46,6 @@ async def test_generate_report_with_empty_data():
     assert report.final_prices == {}
 
 
-@pytest.mark.asyncio
 async def test_report_to_dict_includes_all_fields():
     """to_dict should convert report to dictionary with all fields present."""
     vault_address = "0xVault"
@@ -62,6 +59,7 @@ async def test_report_to_dict_includes_all_fields():
     report_dict = report.to_dict()
 
     assert isinstance(report_dict, dict)
+    assert report_dict.keys() == {field.name for field in fields(OracleReport)}
     assert "vault_address" in report_dict
     assert "base_asset" in report_dict
     assert "tvl_in_base_asset" in report_dict
@@ -74,7 +72,6 @@ async def test_report_to_dict_includes_all_fields():
     assert report_dict["final_prices"] == {"0xA": 10**18}
 
 
-@pytest.mark.asyncio
 async def test_report_to_dict_serializable():
     """to_dict output should be JSON-serializable for publishing."""
     import json
@@ -102,7 +99,6 @@ async def test_report_to_dict_serializable():
     assert deserialized["total_assets"]["0xUSDC"] == 123456
 
 
-@pytest.mark.asyncio
 async def test_multiple_assets_and_prices_in_report():
     """Report should correctly handle multiple assets with their corresponding prices."""
     vault_address = "0xMultiAssetVault"
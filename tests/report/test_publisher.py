@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import requests
 
+from tq_oracle import abi
 from tq_oracle.settings import OracleSettings
+from tq_oracle.report import publisher
 from tq_oracle.report.generator import OracleReport
 from tq_oracle.report.publisher import (
     build_transaction,
@@ -14,7 +16,7 @@ from tq_oracle.report.publisher import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_report() -> OracleReport:
     """Provides a sample OracleReport for testing."""
     return OracleReport(
@@ -42,7 +44,6 @@ def broadcast_config() -> OracleSettings:
     )
 
 
-@pytest.mark.asyncio
 async def test_publish_to_stdout_prints_correct_json(
     capsys, sample_report: OracleReport
 ):
@@ -65,9 +66,8 @@ async def test_publish_to_stdout_prints_correct_json(
     }
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.encode_submit_reports")
-@patch("tq_oracle.abi.get_oracle_address_from_vault")
+@patch.object(publisher, "encode_submit_reports")
+@patch.object(abi, "get_oracle_address_from_vault")
 async def test_build_transaction_creates_valid_tx_dict(
     mock_get_oracle: MagicMock,
     mock_encode_submit_reports: MagicMock,
@@ -100,13 +100,12 @@ async def test_build_transaction_creates_valid_tx_dict(
     }
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.SafeTx")
-@patch("tq_oracle.report.publisher.asyncio.to_thread")
-@patch("tq_oracle.report.publisher.Account")
-@patch("tq_oracle.report.publisher.TransactionServiceApi")
-@patch("tq_oracle.report.publisher.EthereumClient")
-@patch("tq_oracle.report.publisher.asyncio.sleep", new_callable=AsyncMock)
+@patch.object(publisher, "SafeTx")
+@patch.object(publisher.asyncio, "to_thread")
+@patch.object(publisher, "Account")
+@patch.object(publisher, "TransactionServiceApi")
+@patch.object(publisher, "EthereumClient")
+@patch.object(publisher.asyncio, "sleep", new_callable=AsyncMock)
 async def test_send_to_safe_happy_path(
     mock_sleep: AsyncMock,
     MockEthClient: MagicMock,
@@ -139,7 +138,7 @@ async def test_send_to_safe_happy_path(
     mock_tx_service_instance.post_transaction = MagicMock()
 
     async def to_thread_side_effect(func, *args, **kwargs):
-        if hasattr(func, "__name__") and func.__name__ == "get":
+        if func is mock_tx_service_instance.http_session.get:
             return mock_get_response
         return None
 
@@ -160,7 +159,7 @@ async def test_send_to_safe_happy_path(
     )
 
     get_call = mock_to_thread.call_args_list[0]
-    assert get_call.args[0].__name__ == "get"
+    assert get_call.args[0] is mock_tx_service_instance.http_session.get
     assert f"/api/v1/safes/{broadcast_config.safe_address}/" in get_call.args[1]
 
     MockSafeTx.assert_called_once()
@@ -186,7 +185,6 @@ async def test_send_to_safe_happy_path(
     assert "#0xTxHash" in result_url
 
 
-@pytest.mark.asyncio
 async def test_send_to_safe_raises_error_if_config_missing(
     broadcast_config: OracleSettings,
 ):
@@ -205,9 +203,8 @@ async def test_send_to_safe_raises_error_if_config_missing(
         await send_to_safe(config_no_key, transaction)
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.Account")
-@patch("tq_oracle.report.publisher.asyncio.to_thread")
+@patch.object(publisher, "Account")
+@patch.object(publisher.asyncio, "to_thread")
 async def test_send_to_safe_handles_http_error_on_nonce_fetch(
     mock_to_thread: MagicMock,
     MockAccount: MagicMock,
@@ -230,9 +227,8 @@ async def test_send_to_safe_handles_http_error_on_nonce_fetch(
         await send_to_safe(broadcast_config, {})
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.publish_to_stdout", new_callable=AsyncMock)
-@patch("tq_oracle.report.publisher.send_to_safe", new_callable=AsyncMock)
+@patch.object(publisher, "publish_to_stdout", new_callable=AsyncMock)
+@patch.object(publisher, "send_to_safe", new_callable=AsyncMock)
 async def test_publish_report_routes_to_stdout_on_dry_run(
     mock_send_to_safe: AsyncMock,
     mock_publish_to_stdout: AsyncMock,
@@ -254,9 +250,8 @@ async def test_publish_report_routes_to_stdout_on_dry_run(
     mock_send_to_safe.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.send_to_safe", new_callable=AsyncMock)
-@patch("tq_oracle.report.publisher.build_transaction", new_callable=AsyncMock)
+@patch.object(publisher, "send_to_safe", new_callable=AsyncMock)
+@patch.object(publisher, "build_transaction", new_callable=AsyncMock)
 async def test_publish_report_routes_to_broadcast_flow(
     mock_build_transaction: AsyncMock,
     mock_send_to_safe: AsyncMock,
@@ -283,9 +278,8 @@ async def test_publish_report_routes_to_broadcast_flow(
     assert "Approve here: http://safe.url" in caplog.text
 
 
-@pytest.mark.asyncio
-@patch("tq_oracle.report.publisher.send_to_safe", new_callable=AsyncMock)
-@patch("tq_oracle.report.publisher.build_transaction", new_callable=AsyncMock)
+@patch.object(publisher, "send_to_safe", new_callable=AsyncMock)
+@patch.object(publisher, "build_transaction", new_callable=AsyncMock)
 async def test_publish_report_handles_broadcast_error_and_exits(
     mock_build_transaction: AsyncMock,
     mock_send_to_safe: AsyncMock,
@@ -311,7 +305,6 @@ async def test_publish_report_handles_broadcast_error_and_exits(
     assert "❌ Error: Missing API key" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_publish_report_raises_for_unsupported_direct_mode(
     broadcast_config: OracleSettings, sample_report: OracleReport
 ):
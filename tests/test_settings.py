@@ -4,40 +4,48 @@ from __future__ import annotations
 
 from textwrap import dedent
 
+import pytest
+
 from tq_oracle.settings import OracleSettings
 
 
-def test_promotes_root_flags_from_subvault_block(tmp_path, monkeypatch):
-    """Ensure root-level flags defined after subvault adapters are respected."""
+@pytest.fixture
+def settings_from_toml(tmp_path, monkeypatch):
+    """Build `OracleSettings` from a TOML config file with the given body."""
 
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        dedent(
-            """
-            vault_address = "0x123"
-            vault_rpc = "https://rpc.example"
-            dry_run = true
-
-            [[subvault_adapters]]
-            subvault_address = "0xabc"
-            additional_adapters = ["idle_balances"]
-
-            ignore_timeout_check = true
-            ignore_empty_vault = true
-            ignore_active_proposal_check = true
-            pre_check_retries = 7
-            pre_check_timeout = 42.5
-            max_calls = 9
-            rpc_max_concurrent_calls = 4
-            rpc_delay = 0.33
-            rpc_jitter = 0.21
-            """
-        ).strip()
-    )
+    def load(body: str) -> OracleSettings:
+        config_path = tmp_path / "config.toml"
+        config_path.write_text(dedent(body).strip())
+        monkeypatch.setenv("TQ_ORACLE_CONFIG", str(config_path))
+        return OracleSettings()
+
+    return load
 
-    monkeypatch.setenv("TQ_ORACLE_CONFIG", str(config_path))
 
-    settings = OracleSettings()
+def test_promotes_root_flags_from_subvault_block(settings_from_toml):
+    """Ensure root-level flags defined after subvault adapters are respected."""
+
+    settings = settings_from_toml(
+        """
+        vault_address = "0x123"
+        vault_rpc = "https://rpc.example"
+        dry_run = true
+
+        [[subvault_adapters]]
+        subvault_address = "0xabc"
+        additional_adapters = ["idle_balances"]
+
+        ignore_timeout_check = true
+        ignore_empty_vault = true
+        ignore_active_proposal_check = true
+        pre_check_retries = 7
+        pre_check_timeout = 42.5
+        max_calls = 9
+        rpc_max_concurrent_calls = 4
+        rpc_delay = 0.33
+        rpc_jitter = 0.21
+        """
+    )
 
     assert settings.ignore_timeout_check is True
     assert settings.ignore_empty_vault is True
@@ -57,47 +65,33 @@ def test_promotes_root_flags_from_subvault_block(tmp_path, monkeypatch):
     ]
 
 
-def test_idle_balances_extra_tokens_loaded(tmp_path, monkeypatch):
+def test_idle_balances_extra_tokens_loaded(settings_from_toml):
     """Ensure idle balance extra token addresses load from config."""
 
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        dedent(
-            """
-            [adapters.idle_balances]
-            extra_tokens = { osETH = "0xf1C9acDc66974dFB6dEcB12aA385b9cD01190E38" }
-            """
-        ).strip()
+    settings = settings_from_toml(
+        """
+        [adapters.idle_balances]
+        extra_tokens = { osETH = "0xf1C9acDc66974dFB6dEcB12aA385b9cD01190E38" }
+        """
     )
 
-    monkeypatch.setenv("TQ_ORACLE_CONFIG", str(config_path))
-
-    settings = OracleSettings()
-
     assert settings.adapters.idle_balances.extra_tokens == {
         "osETH": "0xf1C9acDc66974dFB6dEcB12aA385b9cD01190E38"
     }
 
 
-def test_stakewise_adapter_defaults_loaded(tmp_path, monkeypatch):
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        dedent(
-            """
-            [adapters.stakewise]
-            stakewise_vault_addresses = ["0x1111111111111111111111111111111111111111"]
-            stakewise_exit_queue_start_block = 123
-            stakewise_exit_max_lookback_blocks = 50000
-            extra_addresses = ["0x2222222222222222222222222222222222222222"]
-            skip_exit_queue_scan = true
-            """
-        ).strip()
+def test_stakewise_adapter_defaults_loaded(settings_from_toml):
+    settings = settings_from_toml(
+        """
+        [adapters.stakewise]
+        stakewise_vault_addresses = ["0x1111111111111111111111111111111111111111"]
+        stakewise_exit_queue_start_block = 123
+        stakewise_exit_max_lookback_blocks = 50000
+        extra_addresses = ["0x2222222222222222222222222222222222222222"]
+        skip_exit_queue_scan = true
+        """
     )
 
-    monkeypatch.setenv("TQ_ORACLE_CONFIG", str(config_path))
-
-    settings = OracleSettings()
-
     assert settings.adapters.stakewise.stakewise_vault_addresses == [
         "0x1111111111111111111111111111111111111111"
     ]
@@ -109,18 +103,24 @@ def test_stakewise_adapter_defaults_loaded(tmp_path, monkeypatch):
     assert settings.adapters.stakewise.skip_exit_queue_scan is True
 
 
-def test_additional_asset_support_toggle(tmp_path, monkeypatch):
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        dedent(
-            """
-            additional_asset_support = false
-            """
-        ).strip()
+def test_additional_asset_support_toggle(settings_from_toml):
+    settings = settings_from_toml(
+        """
+        additional_asset_support = false
+        """
     )
 
-    monkeypatch.setenv("TQ_ORACLE_CONFIG", str(config_path))
+    assert settings.additional_asset_support is False
+
 
-    settings = OracleSettings()
+@pytest.mark.parametrize("secret", ["private_key", "safe_txn_srvc_api_key"])
+def test_rejects_secrets_in_config_file(settings_from_toml, secret):
+    with pytest.raises(ValueError, match=f"Security violation: '{secret}'"):
+        settings_from_toml(f'{secret} = "0xdeadbeef"')
 
-    assert settings.additional_asset_support is False
+
+def test_empty_config_file_uses_defaults(settings_from_toml):
+    settings = settings_from_toml("")
+
+    assert settings.subvault_adapters == []
+    assert settings.additional_asset_support is True
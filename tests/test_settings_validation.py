@@ -5,94 +5,76 @@ from pydantic import ValidationError
 
 from tq_oracle.settings import Network, OracleSettings
 
+ORDERING_ERROR = "price_warning_tolerance_percentage.*must be less than.*price_failure_tolerance_percentage"
 
-def test_price_tolerance_positive_validation():
-    """Test that price tolerances must be positive."""
-    # Negative warning tolerance
-    with pytest.raises(ValidationError, match="greater than 0"):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_warning_tolerance_percentage=-0.5,
-        )
 
-    # Zero failure tolerance
-    with pytest.raises(ValidationError, match="greater than 0"):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_failure_tolerance_percentage=0,
-        )
+@pytest.fixture(scope="module")
+def base_kwargs():
+    """Minimal valid settings shared by every validation case."""
+    return {
+        "vault_address": "0xVault",
+        "vault_rpc": "https://eth.drpc.org",
+        "network": Network.MAINNET,
+    }
 
 
-def test_price_tolerance_upper_bound_validation():
-    """Test that price tolerances have reasonable upper bounds."""
-    # Warning tolerance too high
-    with pytest.raises(ValidationError, match="less than 100"):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_warning_tolerance_percentage=150.0,
-        )
+@pytest.mark.parametrize(
+    "overrides, match",
+    [
+        pytest.param(
+            {"price_warning_tolerance_percentage": -0.5},
+            "greater than 0",
+            id="negative_warning",
+        ),
+        pytest.param(
+            {"price_failure_tolerance_percentage": 0},
+            "greater than 0",
+            id="zero_failure",
+        ),
+        pytest.param(
+            {"price_warning_tolerance_percentage": 150.0},
+            "less than 100",
+            id="warning_too_high",
+        ),
+        pytest.param(
+            {"price_failure_tolerance_percentage": 1000.0},
+            "less than 100",
+            id="failure_too_high",
+        ),
+        pytest.param(
+            {
+                "price_warning_tolerance_percentage": 1.0,
+                "price_failure_tolerance_percentage": 1.0,
+            },
+            ORDERING_ERROR,
+            id="warning_equals_failure",
+        ),
+        pytest.param(
+            {
+                "price_warning_tolerance_percentage": 2.0,
+                "price_failure_tolerance_percentage": 1.0,
+            },
+            ORDERING_ERROR,
+            id="warning_above_failure",
+        ),
+    ],
+)
+def test_invalid_price_tolerance_rejected(base_kwargs, overrides, match):
+    """Test that out-of-range or misordered price tolerances are rejected."""
+    with pytest.raises(ValidationError, match=match):
+        OracleSettings(**base_kwargs, **overrides)
 
-    # Failure tolerance too high
-    with pytest.raises(ValidationError, match="less than 100"):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_failure_tolerance_percentage=1000.0,
-        )
 
-
-def test_price_tolerance_ordering_validation():
-    """Test that warning tolerance must be less than failure tolerance."""
-    # Warning equal to failure (invalid)
-    with pytest.raises(
-        ValueError,
-        match="price_warning_tolerance_percentage.*must be less than.*price_failure_tolerance_percentage",
-    ):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_warning_tolerance_percentage=1.0,
-            price_failure_tolerance_percentage=1.0,
-        )
-
-    # Warning greater than failure (invalid)
-    with pytest.raises(
-        ValueError,
-        match="price_warning_tolerance_percentage.*must be less than.*price_failure_tolerance_percentage",
-    ):
-        OracleSettings(
-            vault_address="0xVault",
-            vault_rpc="https://eth.drpc.org",
-            network=Network.MAINNET,
-            price_warning_tolerance_percentage=2.0,
-            price_failure_tolerance_percentage=1.0,
-        )
-
-
-def test_valid_price_tolerance_configuration():
+def test_valid_price_tolerance_configuration(base_kwargs):
     """Test that valid price tolerance configurations are accepted."""
     # Default values should work
-    config = OracleSettings(
-        vault_address="0xVault",
-        vault_rpc="https://eth.drpc.org",
-        network=Network.MAINNET,
-    )
+    config = OracleSettings(**base_kwargs)
     assert config.price_warning_tolerance_percentage == 0.5
     assert config.price_failure_tolerance_percentage == 1.0
 
     # Custom valid values should work
     config = OracleSettings(
-        vault_address="0xVault",
-        vault_rpc="https://eth.drpc.org",
-        network=Network.MAINNET,
+        **base_kwargs,
         price_warning_tolerance_percentage=0.1,
         price_failure_tolerance_percentage=0.5,
     )
@@ -101,9 +83,7 @@ def test_valid_price_tolerance_configuration():
 
     # Edge case: very small difference
     config = OracleSettings(
-        vault_address="0xVault",
-        vault_rpc="https://eth.drpc.org",
-        network=Network.MAINNET,
+        **base_kwargs,
         price_warning_tolerance_percentage=0.1,
         price_failure_tolerance_percentage=0.101,
     )